@@ -11,6 +11,8 @@ from backend.app.config import settings
 from backend.app.domain.incident import Incident
 from backend.app.domain.site import Site
 from backend.app.domain.evidence import Evidence
+from backend.app.domain.intelligence_snapshot import IntelligenceSnapshot
+from backend.app.domain.llm_cache_entry import LLMCacheEntry
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
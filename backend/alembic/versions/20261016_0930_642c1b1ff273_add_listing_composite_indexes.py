@@ -0,0 +1,44 @@
+"""Add listing composite indexes
+
+Revision ID: 642c1b1ff273
+Revises: 5c91c648da0e
+Create Date: 2026-10-16 09:30:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '642c1b1ff273'
+down_revision: Union[str, None] = '5c91c648da0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /incidents: WHERE country_code = ? ORDER BY id DESC
+    op.create_index(
+        'ix_incidents_country_code_id_desc',
+        'incidents',
+        ['country_code', sa.text('id DESC')],
+        unique=False,
+    )
+    # /sites: WHERE type = ? AND country_code = ? ORDER BY name
+    op.create_index(
+        'ix_sites_type_country_code_name',
+        'sites',
+        ['type', 'country_code', 'name'],
+        unique=False,
+    )
+
+    # Refresh planner statistics so the new indexes are picked up immediately
+    op.execute('ANALYZE incidents')
+    op.execute('ANALYZE sites')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sites_type_country_code_name', table_name='sites')
+    op.drop_index('ix_incidents_country_code_id_desc', table_name='incidents')
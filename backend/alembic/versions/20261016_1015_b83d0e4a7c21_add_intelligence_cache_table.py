@@ -0,0 +1,34 @@
+"""Add intelligence_cache table
+
+Revision ID: b83d0e4a7c21
+Revises: 642c1b1ff273
+Create Date: 2026-10-16 10:15:47.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83d0e4a7c21'
+down_revision: Union[str, None] = '642c1b1ff273'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('intelligence_cache',
+    sa.Column('incident_id', sa.Integer(), nullable=False),
+    sa.Column('evidence_fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('payload', sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'), nullable=False),
+    sa.Column('generated_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['incident_id'], ['incidents.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('incident_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('intelligence_cache')
@@ -0,0 +1,50 @@
+"""Metadata columns to jsonb
+
+Revision ID: 97b34dfe9ca2
+Revises: 842ed896c59d
+Create Date: 2026-10-16 13:05:31.660417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '97b34dfe9ca2'
+down_revision: Union[str, None] = '842ed896c59d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs stored as free-form metadata
+_METADATA_COLUMNS = (
+    ('sites', 'site_metadata'),
+    ('incidents', 'raw_metadata'),
+    ('evidence', 'meta'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _METADATA_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table, column in _METADATA_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,61 @@
+"""Enum columns to varchar + check constraint
+
+Revision ID: 30cbca939b7b
+Revises: 97b34dfe9ca2
+Create Date: 2026-10-16 13:50:19.084536
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '30cbca939b7b'
+down_revision: Union[str, None] = '97b34dfe9ca2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Stored labels are the enum member names, as before
+SITE_TYPES = ('AIRPORT', 'MILITARY', 'POWER_PLANT', 'GOVERNMENT', 'PRISON', 'STADIUM', 'CRITICAL_INFRASTRUCTURE', 'OTHER')
+SOURCE_TYPES = ('NEWS', 'SOCIAL_MEDIA', 'OFFICIAL_REPORT', 'FORUM', 'TELEGRAM', 'REDDIT', 'OTHER')
+
+# (table, column, native enum type, check constraint, labels)
+_ENUM_COLUMNS = (
+    ('sites', 'type', 'sitetype', 'ck_sites_type', SITE_TYPES),
+    ('evidence', 'source_type', 'sourcetype', 'ck_evidence_source_type', SOURCE_TYPES),
+)
+
+
+def _in_list(labels: Sequence[str]) -> str:
+    return ', '.join(f"'{label}'" for label in labels)
+
+
+def upgrade() -> None:
+    for table, column, enum_name, constraint, labels in _ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=32),
+            existing_type=postgresql.ENUM(*labels, name=enum_name),
+            existing_nullable=False,
+            postgresql_using=f'{column}::text',
+        )
+        op.create_check_constraint(constraint, table, f'{column} IN ({_in_list(labels)})')
+        op.execute(f'DROP TYPE {enum_name}')
+
+
+def downgrade() -> None:
+    for table, column, enum_name, constraint, labels in _ENUM_COLUMNS:
+        postgresql.ENUM(*labels, name=enum_name).create(op.get_bind())
+        op.drop_constraint(constraint, table, type_='check')
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ENUM(*labels, name=enum_name),
+            existing_type=sa.String(length=32),
+            existing_nullable=False,
+            postgresql_using=f'{column}::{enum_name}',
+        )
@@ -0,0 +1,54 @@
+"""Add composite query indexes
+
+Revision ID: d41f6a2c8e93
+Revises: 30cbca939b7b
+Create Date: 2026-10-16 14:30:08.237914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6a2c8e93'
+down_revision: Union[str, None] = '30cbca939b7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns)
+_COMPOSITE_INDEXES = (
+    # WHERE country_code = ? ORDER BY occurred_at DESC (backward index scan)
+    ('ix_incidents_country_code_occurred_at', 'incidents', ['country_code', 'occurred_at']),
+    # WHERE site_id = ? ORDER BY occurred_at DESC
+    ('ix_incidents_site_id_occurred_at', 'incidents', ['site_id', 'occurred_at']),
+    # WHERE incident_id = ? [AND source_type = ?]
+    ('ix_evidence_incident_id_source_type', 'evidence', ['incident_id', 'source_type']),
+    # WHERE incident_id = ? ORDER BY published_at
+    ('ix_evidence_incident_id_published_at', 'evidence', ['incident_id', 'published_at']),
+)
+
+# Single-column indexes now served by the leading column of a composite
+_REDUNDANT_INDEXES = (
+    ('ix_incidents_country_code', 'incidents', ['country_code']),
+    ('ix_incidents_site_id', 'incidents', ['site_id']),
+    ('ix_evidence_incident_id', 'evidence', ['incident_id']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _COMPOSITE_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _ in _REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    # Refresh planner statistics so the new indexes are picked up immediately
+    op.execute('ANALYZE incidents')
+    op.execute('ANALYZE evidence')
+
+
+def downgrade() -> None:
+    for name, table, columns in _REDUNDANT_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _ in reversed(_COMPOSITE_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,45 @@
+"""Timestamp indexes to BRIN
+
+Incidents and evidence are ingested append-mostly, so occurred_at and
+published_at correlate with physical row order. A BRIN index stores one
+min/max summary per block range, a tiny fraction of the B-tree it replaces,
+and is enough for range scans over dashboard time windows. Nothing looks
+rows up by exact timestamp, so no B-tree is kept; per-incident ordering by
+published_at is served by ix_evidence_incident_id_published_at.
+
+If a bulk backfill loads old rows out of order, the BRIN ranges widen and
+lose selectivity; run brin_summarize_new_values() or REINDEX afterwards.
+
+Revision ID: 6e2b9c0d7a15
+Revises: d41f6a2c8e93
+Create Date: 2026-10-16 15:10:42.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2b9c0d7a15'
+down_revision: Union[str, None] = 'd41f6a2c8e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (B-tree index, BRIN index, table, column)
+_TIMESTAMP_INDEXES = (
+    ('ix_incidents_occurred_at', 'ix_incidents_occurred_at_brin', 'incidents', 'occurred_at'),
+    ('ix_evidence_published_at', 'ix_evidence_published_at_brin', 'evidence', 'published_at'),
+)
+
+
+def upgrade() -> None:
+    for btree, brin, table, column in _TIMESTAMP_INDEXES:
+        op.create_index(brin, table, [column], unique=False, postgresql_using='brin')
+        op.drop_index(btree, table_name=table)
+
+
+def downgrade() -> None:
+    for btree, brin, table, column in _TIMESTAMP_INDEXES:
+        op.create_index(btree, table, [column], unique=False)
+        op.drop_index(brin, table_name=table)
@@ -0,0 +1,39 @@
+"""Intelligence cache generated_at server default
+
+Revision ID: a9c3e51f2b84
+Revises: 6e2b9c0d7a15
+Create Date: 2026-10-16 16:00:27.551903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e51f2b84'
+down_revision: Union[str, None] = '6e2b9c0d7a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stamped by the database clock rather than each API worker's
+    op.alter_column(
+        'intelligence_cache',
+        'generated_at',
+        server_default=sa.text('now()'),
+        existing_type=sa.TIMESTAMP(timezone=True),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'intelligence_cache',
+        'generated_at',
+        server_default=None,
+        existing_type=sa.TIMESTAMP(timezone=True),
+        existing_nullable=False,
+    )
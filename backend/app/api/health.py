@@ -1,30 +1,80 @@
 """Health check endpoint."""
 
+import asyncio
+import time
+from typing import Optional
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from backend.app.db.session import get_db
 
 router = APIRouter()
 
+# Probes (load balancer, k8s liveness) fire more often than this, so a
+# database result is reused for this many seconds instead of re-querying
+_DB_STATUS_TTL_SECONDS = 1.0
+
+_last_db_check = {"ts": 0.0, "status": None}
+_db_check_lock = asyncio.Lock()
+
+
+def _cached_db_status() -> Optional[str]:
+    """Return the last database status if it is still fresh."""
+    if time.monotonic() - _last_db_check["ts"] < _DB_STATUS_TTL_SECONDS:
+        return _last_db_check["status"]
+    return None
+
+
+async def _check_database(db: AsyncSession, force: bool) -> str:
+    """
+    Run (or reuse) the database connectivity probe.
+
+    Concurrent callers share one refresh: whoever holds the lock runs
+    SELECT 1, the others pick up its result.
+
+    Args:
+        db: Database session
+        force: Bypass the cached result
+
+    Returns:
+        str: "healthy" or "unhealthy: <error>"
+    """
+    if not force:
+        status = _cached_db_status()
+        if status is not None:
+            return status
+
+    async with _db_check_lock:
+        if not force:
+            status = _cached_db_status()
+            if status is not None:
+                return status
+
+        try:
+            await db.execute(text("SELECT 1"))
+            status = "healthy"
+        except Exception as e:
+            status = f"unhealthy: {str(e)}"
+
+        _last_db_check["ts"] = time.monotonic()
+        _last_db_check["status"] = status
+
+    return status
+
 
 @router.get("/health")
-def health_check(db: Session = Depends(get_db)) -> dict:
+async def health_check(force: bool = False, db: AsyncSession = Depends(get_db)) -> dict:
     """
     Health check endpoint to verify API and database connectivity.
 
     Args:
+        force: Skip the short-lived cached database status (for manual debugging)
         db: Database session (injected)
 
     Returns:
         dict: Health status with API and database status
     """
-    # Test database connection
-    try:
-        db.execute(text("SELECT 1"))
-        db_status = "healthy"
-    except Exception as e:
-        db_status = f"unhealthy: {str(e)}"
+    db_status = await _check_database(db, force)
 
     return {
         "status": "ok" if db_status == "healthy" else "degraded",
@@ -1,10 +1,12 @@
 """Sites API endpoints."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 from backend.app.db.session import get_db
+from backend.app.api.streaming import MAX_LIST_LIMIT, ndjson_response
 from backend.app.domain.site import Site, SiteType
 
 router = APIRouter()
@@ -18,7 +20,7 @@ class SiteResponse(BaseModel):
     type: SiteType
     country_code: Optional[str] = None
     geom_wkt: Optional[str] = None
-    metadata: Optional[dict] = None
+    metadata: Optional[dict] = Field(None, validation_alias="site_metadata")
 
     class Config:
         from_attributes = True  # Allow ORM model conversion
@@ -28,44 +30,98 @@ class SiteListResponse(BaseModel):
     """Response schema for list of sites."""
     total: int
     sites: List[SiteResponse]
+    next_cursor: Optional[int] = None  # Pass as ?after_id= to fetch the next page
+
+
+# Validates a whole page of rows in one pydantic-core call
+_SITE_LIST_ADAPTER = TypeAdapter(List[SiteResponse])
+
+# Columns projected by the list endpoint (site_metadata is opt-in via ?expand=metadata)
+_SITE_LIST_COLUMNS = (
+    Site.id,
+    Site.name,
+    Site.type,
+    Site.country_code,
+    Site.geom_wkt,
+)
 
 
 @router.get("/sites", response_model=SiteListResponse)
-def list_sites(
+async def list_sites(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     site_type: Optional[SiteType] = None,
     country_code: Optional[str] = None,
-    db: Session = Depends(get_db)
+    expand: Optional[str] = None,
+    stream: bool = False,
+    db: AsyncSession = Depends(get_db)
 ) -> SiteListResponse:
     """
     List sites with optional filtering.
 
     Args:
-        skip: Number of records to skip (pagination)
-        limit: Maximum number of records to return
+        skip: Number of records to skip (offset pagination, kept for compatibility)
+        limit: Maximum number of records to return (capped at MAX_LIST_LIMIT)
+        after_id: Keyset cursor (next_cursor of the previous page); overrides skip
         site_type: Filter by site type (e.g., "military", "airport")
         country_code: Filter by country code (e.g., "NL")
+        expand: Comma-separated optional fields to include ("metadata")
+        stream: Return the rows as NDJSON (no total) instead of one JSON body
         db: Database session (injected)
 
     Returns:
         SiteListResponse: List of sites with total count
+
+    Raises:
+        HTTPException: 400 if the after_id cursor row no longer exists
     """
-    query = db.query(Site)
+    limit = min(limit, MAX_LIST_LIMIT)
+
+    columns = list(_SITE_LIST_COLUMNS)
+    if expand and "metadata" in expand.split(","):
+        columns.append(Site.site_metadata)
 
     # Apply filters
+    filters = []
     if site_type:
-        query = query.filter(Site.type == site_type)
+        filters.append(Site.type == site_type)
     if country_code:
-        query = query.filter(Site.country_code == country_code.upper())
+        filters.append(Site.country_code == country_code.upper())
+
+    page = select(*columns).where(*filters).order_by(Site.name, Site.id).limit(limit)
+    if after_id is not None:
+        # Keyset page on (name, id). A deleted cursor row would otherwise
+        # compare against NULL and silently end the listing
+        after_name = await db.scalar(select(Site.name).where(Site.id == after_id))
+        if after_name is None:
+            raise HTTPException(status_code=400, detail=f"Cursor site {after_id} no longer exists")
+        page = page.where(tuple_(Site.name, Site.id) > tuple_(after_name, after_id))
+    else:
+        page = page.offset(skip)
+
+    if stream:
+        # Rows are encoded as they arrive from the server-side cursor
+        return ndjson_response(db, page, SiteResponse)
 
-    # Get total count
-    total = query.count()
+    if after_id is None:
+        # Offset page: the total count rides along in the same round trip
+        # (only the projected columns are fetched)
+        result = await db.execute(page.add_columns(func.count().over().label("total")))
+    else:
+        result = await db.execute(page)
+    rows = result.mappings().all()
 
-    # Get paginated results
-    sites = query.order_by(Site.name).offset(skip).limit(limit).all()
+    if rows and after_id is None:
+        total = rows[0]["total"]
+    elif skip or after_id is not None:
+        # The window only sees rows after the cursor (or none past the end)
+        total = await db.scalar(select(func.count(Site.id)).where(*filters))
+    else:
+        total = 0
 
     return SiteListResponse(
         total=total,
-        sites=[SiteResponse.model_validate(site) for site in sites]
+        sites=_SITE_LIST_ADAPTER.validate_python(rows),
+        next_cursor=rows[-1]["id"] if rows and len(rows) == limit else None,
     )
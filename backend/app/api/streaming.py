@@ -0,0 +1,52 @@
+"""Streaming helpers for list endpoints.
+
+Large listings can be requested as NDJSON (one JSON object per line) so
+clients process rows as they arrive and the API never buffers the page.
+
+Architecture Layer: api/
+Dependencies: sqlalchemy, pydantic
+"""
+
+from typing import AsyncIterator, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Hard cap on ?limit= for list endpoints
+MAX_LIST_LIMIT = 1000
+
+# Rows fetched per server-side batch when streaming
+STREAM_BATCH_SIZE = 200
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_lines(
+    db: AsyncSession,
+    stmt: Select,
+    model: Type[BaseModel],
+) -> AsyncIterator[bytes]:
+    """Yield one encoded line per row of stmt."""
+    result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+    async for row in result.mappings():
+        yield model.model_validate(row).model_dump_json().encode() + b"\n"
+
+
+def ndjson_response(
+    db: AsyncSession,
+    stmt: Select,
+    model: Type[BaseModel],
+) -> StreamingResponse:
+    """
+    Stream the rows of a select as NDJSON.
+
+    Args:
+        db: Database session (must stay open until the response is sent)
+        stmt: Select producing the columns of model
+        model: Response schema used to validate and encode each row
+
+    Returns:
+        StreamingResponse: application/x-ndjson body, one object per line
+    """
+    return StreamingResponse(_ndjson_lines(db, stmt, model), media_type=NDJSON_MEDIA_TYPE)
@@ -1,36 +1,63 @@
 """Database session management and engine configuration."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from typing import AsyncIterator
 from backend.app.config import settings
 
 
+def _async_database_url(url: str) -> str:
+    """Map the configured sync DSN onto the asyncpg driver (Alembic keeps psycopg2)."""
+    return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def _pool_options() -> dict:
+    """Pool keyword arguments for the engine, driven by settings."""
+    if settings.POOL_DISABLED:
+        # PgBouncer (port 6432) owns pooling; open/close per checkout
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.POOL_TIMEOUT,
+        "pool_recycle": settings.POOL_RECYCLE,
+        "pool_use_lifo": settings.POOL_USE_LIFO,
+    }
+
+
 # Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
     pool_pre_ping=True,  # Verify connections before using them
-    echo=settings.ENVIRONMENT == "development"  # Log SQL in dev mode
+    echo=settings.SQL_ECHO,  # Opt-in SQL logging
+    **_pool_options(),
 )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency injection for database sessions.
 
+    One session per request, closed by FastAPI after the response is sent
+    (so NDJSON streams keep their session). A session only checks out a
+    pool connection on its first query. scoped_session is thread-local and
+    has no equivalent here: handlers share one event-loop thread, and
+    http middleware runs the endpoint in a different task.
+
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy async database session
 
     Usage:
         @app.get("/endpoint")
-        def endpoint(db: Session = Depends(get_db)):
-            # Use db here
+        async def endpoint(db: AsyncSession = Depends(get_db)):
+            # Use await db.execute(...) here
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,8 @@
+"""Dialect-aware column types shared by the ORM models."""
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Binary jsonb in PostgreSQL (parsed once on write, GIN-indexable);
+# plain JSON on other dialects (SQLite in local scripts and tests)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
@@ -4,5 +4,7 @@
 from backend.app.domain.site import Site, SiteType
 from backend.app.domain.incident import Incident
 from backend.app.domain.evidence import Evidence, SourceType
+from backend.app.domain.intelligence_snapshot import IntelligenceSnapshot
+from backend.app.domain.llm_cache_entry import LLMCacheEntry
 
-__all__ = ["Site", "SiteType", "Incident", "Evidence", "SourceType"]
+__all__ = ["Site", "SiteType", "Incident", "Evidence", "SourceType", "IntelligenceSnapshot", "LLMCacheEntry"]
@@ -1,8 +1,9 @@
 """Evidence domain model."""
 
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, TIMESTAMP, JSON
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Index, TIMESTAMP
 from sqlalchemy.orm import relationship
 from backend.app.db.base import Base
+from backend.app.db.types import JSONBType
 import enum
 
 
@@ -34,16 +35,29 @@ class Evidence(Base):
     """
 
     __tablename__ = "evidence"
+    __table_args__ = (
+        # Per-incident evidence lookups, optionally by source or recency.
+        # Together they also cover plain incident_id lookups.
+        Index("ix_evidence_incident_id_source_type", "incident_id", "source_type"),
+        Index("ix_evidence_incident_id_published_at", "incident_id", "published_at"),
+        # Time-window scans; rows arrive roughly in published_at order
+        Index("ix_evidence_published_at_brin", "published_at", postgresql_using="brin"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=False, index=True)
-    source_type = Column(Enum(SourceType), nullable=False, index=True)
+    incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=False)
+    # VARCHAR + CHECK rather than a native PG enum (see Site.type)
+    source_type = Column(
+        Enum(SourceType, native_enum=False, create_constraint=True, length=32, name="ck_evidence_source_type"),
+        nullable=False,
+        index=True,
+    )
     source_name = Column(String, nullable=True)  # e.g., "Reuters", "Twitter"
     url = Column(String, nullable=True, index=True)
     language = Column(String(2), nullable=True)  # ISO 639-1 code: "en", "nl"
-    published_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
+    published_at = Column(TIMESTAMP(timezone=True), nullable=True)
     raw_text = Column(String, nullable=True)  # Full article text
-    meta = Column(JSON, nullable=True)  # JSONB in PostgreSQL
+    meta = Column(JSONBType, nullable=True)  # JSONB in PostgreSQL
 
     # Relationships
     incident = relationship("Incident", back_populates="evidence")
@@ -1,8 +1,9 @@
 """Incident domain model."""
 
-from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from backend.app.db.base import Base
+from backend.app.db.types import JSONBType
 
 
 class Incident(Base):
@@ -19,13 +20,22 @@ class Incident(Base):
     """
 
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Listing: optional country filter, newest first
+        Index("ix_incidents_country_code_id_desc", "country_code", text("id DESC")),
+        # Dashboard timelines per country / per site
+        Index("ix_incidents_country_code_occurred_at", "country_code", "occurred_at"),
+        Index("ix_incidents_site_id_occurred_at", "site_id", "occurred_at"),
+        # Time-window scans; rows arrive roughly in occurred_at order
+        Index("ix_incidents_occurred_at_brin", "occurred_at", postgresql_using="brin"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, nullable=False, index=True)
-    country_code = Column(String(2), index=True)  # e.g., "NL", "US", "GB"
-    site_id = Column(Integer, ForeignKey("sites.id"), nullable=True, index=True)
-    occurred_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
-    raw_metadata = Column(JSON, nullable=True)  # JSONB in PostgreSQL
+    country_code = Column(String(2))  # e.g., "NL", "US", "GB" (leads the composite indexes)
+    site_id = Column(Integer, ForeignKey("sites.id"), nullable=True)  # leads ix_incidents_site_id_occurred_at
+    occurred_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    raw_metadata = Column(JSONBType, nullable=True)  # JSONB in PostgreSQL
 
     # Relationships
     site = relationship("Site", back_populates="incidents")
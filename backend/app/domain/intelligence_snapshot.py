@@ -0,0 +1,30 @@
+"""Intelligence snapshot domain model."""
+
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, func
+from backend.app.db.base import Base
+from backend.app.db.types import JSONBType
+
+
+class IntelligenceSnapshot(Base):
+    """
+    Materialized intelligence response for an incident.
+
+    Written whenever intelligence is computed (by the API or the precompute
+    script) and served as-is while the evidence fingerprint still matches.
+
+    Attributes:
+        incident_id: Primary key and foreign key to Incident
+        evidence_fingerprint: SHA-256 of the inputs the payload was built from
+        payload: Serialized IntelligenceResponse (JSONB in PostgreSQL)
+        generated_at: When the payload was computed (database clock)
+    """
+
+    __tablename__ = "intelligence_cache"
+
+    incident_id = Column(Integer, ForeignKey("incidents.id", ondelete="CASCADE"), primary_key=True)
+    evidence_fingerprint = Column(String(64), nullable=False)
+    payload = Column(JSONBType, nullable=False)
+    generated_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<IntelligenceSnapshot(incident_id={self.incident_id}, generated_at={self.generated_at})>"
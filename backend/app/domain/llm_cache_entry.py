@@ -0,0 +1,25 @@
+"""LLM cache entry domain model."""
+
+from sqlalchemy import Column, String, TIMESTAMP
+from backend.app.db.base import Base
+from backend.app.db.types import JSONBType
+
+
+class LLMCacheEntry(Base):
+    """
+    Cached LLM response, addressed by the hash of the prompt that produced it.
+
+    Attributes:
+        key: SHA-256 hex digest of model + system prompt + user prompt
+        response: Parsed JSON response from the model (JSONB in PostgreSQL)
+        expires_at: When the entry stops being served
+    """
+
+    __tablename__ = "llm_cache"
+
+    key = Column(String(64), primary_key=True)
+    response = Column(JSONBType, nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<LLMCacheEntry(key={self.key[:12]}..., expires_at={self.expires_at})>"
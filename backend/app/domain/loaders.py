@@ -0,0 +1,30 @@
+"""Eager-loading query builders for domain relationships.
+
+Under AsyncSession an implicit lazy load fails (MissingGreenlet) instead of
+silently issuing one SELECT per row, so any code that touches a relationship
+must load it up front. These builders keep the loader strategy for each
+access pattern in one place:
+
+- collections and many-to-one over many rows: selectinload (one extra
+  SELECT ... WHERE id IN (...) per relationship, no row multiplication)
+- many-to-one on a single row: joinedload (same round trip)
+"""
+
+from typing import List
+from sqlalchemy import Select, select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from backend.app.domain.incident import Incident
+
+
+def incident_full_query() -> Select:
+    """Incidents with their evidence and site (3 queries for any number of rows)."""
+    return select(Incident).options(
+        selectinload(Incident.evidence),
+        selectinload(Incident.site),
+    )
+
+
+def incident_with_site_options() -> List[LoaderOption]:
+    """Loader options for fetching one incident together with its site."""
+    return [joinedload(Incident.site)]
@@ -1,8 +1,9 @@
 """Site domain model."""
 
-from sqlalchemy import Column, Integer, String, Enum, JSON
+from sqlalchemy import Column, Integer, String, Enum, Index
 from sqlalchemy.orm import relationship
 from backend.app.db.base import Base
+from backend.app.db.types import JSONBType
 import enum
 
 
@@ -32,13 +33,23 @@ class Site(Base):
     """
 
     __tablename__ = "sites"
+    __table_args__ = (
+        # Listing: optional type/country filters, ordered by name
+        Index("ix_sites_type_country_code_name", "type", "country_code", "name"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False, index=True)
-    type = Column(Enum(SiteType), nullable=False, index=True)
+    # VARCHAR + CHECK rather than a native PG enum: no ALTER TYPE to add a value,
+    # and the Python enum still round-trips at the ORM boundary
+    type = Column(
+        Enum(SiteType, native_enum=False, create_constraint=True, length=32, name="ck_sites_type"),
+        nullable=False,
+        index=True,
+    )
     country_code = Column(String(2), index=True)  # e.g., "NL", "US", "GB"
     geom_wkt = Column(String, nullable=True)  # WKT format: "POINT(5.7 51.6)"
-    site_metadata = Column(JSON, nullable=True)  # JSONB in PostgreSQL (renamed from 'metadata' which is reserved)
+    site_metadata = Column(JSONBType, nullable=True)  # JSONB in PostgreSQL (renamed from 'metadata' which is reserved)
 
     # Relationships
     incidents = relationship("Incident", back_populates="site")
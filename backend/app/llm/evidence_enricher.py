@@ -8,15 +8,135 @@ This module uses LLM analysis to extract structured intelligence from raw eviden
 - Eyewitness conflict resolution
 
 Architecture Layer: llm/
-Dependencies: services.evidence_stack, Anthropic Claude API
+Dependencies: services.evidence_stack, llm.llm_cache, Anthropic Claude API
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from enum import Enum
+from functools import lru_cache
+import asyncio
 import os
-import json
+import time
+from backend.app.llm import llm_cache
+
+
+# Static analyst instructions, sent as a cached system block so only the
+# per-incident evidence (user message) is billed at the full input rate
+_ANALYSIS_SYSTEM_PROMPT = """You are an intelligence analyst specializing in drone/UAS incident analysis. Analyze the OSINT evidence in the user message and extract structured intelligence signals.
+
+ANALYSIS TASKS:
+
+1. DRONE TYPE SIGNALS
+   - What type of drone is most likely based on evidence?
+   - Consider: size descriptions, sound descriptions, flight characteristics, lighting
+   - Provide confidence score (0-1)
+
+2. FLIGHT DYNAMICS
+   - Approach direction (if mentioned)
+   - Exit direction (if mentioned)
+   - Flight pattern (hovering, circling, straight line, etc.)
+   - Speed estimate (slow, moderate, fast)
+   - Maneuverability (agile, steady, erratic)
+
+3. ALTITUDE RANGE
+   - Estimate minimum and maximum altitude in meters
+   - Provide reasoning based on evidence (visual angle, sound loudness, etc.)
+   - Confidence score (0-1)
+
+4. LIGHTING CONDITIONS
+   - Time of day (dawn, day, dusk, night)
+   - Visibility conditions
+   - Were lights/strobes observed?
+   - Light pattern description
+
+5. EYEWITNESS CONFLICTS
+   - Are there conflicting accounts between different witnesses?
+   - What are the areas of disagreement?
+   - Can you resolve to a consensus view?
+   - Confidence in resolution
+
+ANTI-HALLUCINATION RULES:
+- ONLY extract information that is explicitly stated or strongly implied in the evidence
+- Mark uncertainty clearly when evidence is ambiguous
+- Do NOT invent details not present in the evidence
+- If conflicting accounts exist, acknowledge them rather than forcing consensus
+- Use lower confidence scores when evidence is weak or contradictory
+
+OUTPUT FORMAT: Report your findings by calling the provided tool; its input schema is the required structure.
+"""
+
+# Provider-side prompt cache breakpoint for the static instructions
+_ANALYSIS_SYSTEM_BLOCKS = [
+    {
+        "type": "text",
+        "text": _ANALYSIS_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
+# Per-incident prompt pieces, rendered with str.format and joined once
+_PROMPT_HEADER = """INCIDENT CONTEXT:
+INCIDENT ID: {incident_id}
+TOTAL EVIDENCE ITEMS: {total_items}
+AVERAGE CREDIBILITY: {avg_credibility:.2f}
+
+EVIDENCE BY SOURCE TYPE:
+"""
+
+_PROMPT_ITEM = (
+    "\n{idx}. SOURCE: {source_name} (credibility: {credibility:.2f})\n"
+    "   PUBLISHED: {published}\n"
+    "   TEXT: {text}...\n"
+)
+
+# Evidence text budget per prompt (~4 chars per token). Every item gets at
+# least the floor; the rest is handed out by credibility, highest first, up to
+# the per-item cap, so large stacks spend their tokens on the best sources.
+_PROMPT_TEXT_BUDGET_TOKENS = 6000
+_CHARS_PER_TOKEN = 4
+_MIN_ITEM_CHARS = 200
+_MAX_ITEM_CHARS = 2000
+
+# (section label, EvidenceStack attribute) in prompt order
+_PROMPT_SECTIONS = (
+    ("OFFICIAL_REPORTS", "official_reports"),
+    ("NEWS_ARTICLES", "news_articles"),
+    ("SOCIAL_MEDIA", "social_media_posts"),
+    ("TELEGRAM", "telegram_messages"),
+    ("YOUTUBE", "youtube_videos"),
+    ("FORUMS", "forum_posts"),
+    ("WITNESSES", "witness_statements"),
+)
+
+
+# Model used for live (non-mock) enrichment
+LLM_MODEL = "claude-3-5-sonnet-20241022"
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> Any:
+    """Shared Anthropic client for an API key (None if the SDK is missing).
+
+    Enrichers are created per call; sharing the client keeps its HTTP
+    connection pool, so later calls reuse the open TLS connection.
+    """
+    try:
+        from anthropic import Anthropic
+    except ImportError:
+        return None
+    return Anthropic(api_key=api_key, max_retries=2, timeout=60.0)
+
+
+@lru_cache(maxsize=1)
+def _get_async_client(api_key: str) -> Any:
+    """Shared AsyncAnthropic client for an API key (None if the SDK is missing)."""
+    try:
+        from anthropic import AsyncAnthropic
+    except ImportError:
+        return None
+    return AsyncAnthropic(api_key=api_key, max_retries=2, timeout=60.0)
 
 
 class DroneTypeSignal(str, Enum):
@@ -85,9 +205,56 @@ class EnrichedIncident(BaseModel):
     key_findings: List[str] = Field(default_factory=list, description="Bullet point findings")
 
     # Metadata
-    enriched_at: datetime = Field(default_factory=datetime.utcnow)
+    enriched_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     llm_model: str = Field(default="claude-3-5-sonnet-20241022")
     total_evidence_analyzed: int = Field(default=0)
+    enrichment_failed: bool = Field(default=False, description="Placeholder for a failed LLM call")
+
+
+# Validator compiled once, reused for every parsed response
+_ENRICHED_ADAPTER = TypeAdapter(EnrichedIncident)
+
+# EnrichedIncident fields filled in by the pipeline, not by the model
+_PIPELINE_FIELDS = ("incident_id", "enriched_at", "llm_model", "total_evidence_analyzed", "enrichment_failed")
+
+
+@lru_cache(maxsize=1)
+def _enrichment_schema() -> Dict[str, Any]:
+    """JSON Schema of the model-provided part of EnrichedIncident (shared; do not mutate)."""
+    schema = EnrichedIncident.model_json_schema()
+    for field in _PIPELINE_FIELDS:
+        schema["properties"].pop(field, None)
+    schema["required"] = [f for f in schema.get("required", []) if f not in _PIPELINE_FIELDS]
+    return schema
+
+
+@lru_cache(maxsize=1)
+def _enrichment_tool() -> Dict[str, Any]:
+    """Tool the model must call with one incident's analysis."""
+    return {
+        "name": "record_enrichment",
+        "description": "Record the structured intelligence extracted from the incident evidence.",
+        "input_schema": _enrichment_schema(),
+    }
+
+
+@lru_cache(maxsize=1)
+def _grouped_enrichment_tool() -> Dict[str, Any]:
+    """Tool the model must call with the analyses of several incidents, in order."""
+    item = {k: v for k, v in _enrichment_schema().items() if k != "$defs"}
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {"incidents": {"type": "array", "items": item}},
+        "required": ["incidents"],
+    }
+    if "$defs" in _enrichment_schema():
+        # $ref paths resolve against the root, so the definitions move up
+        schema["$defs"] = _enrichment_schema()["$defs"]
+    return {
+        "name": "record_enrichments",
+        "description": "Record the structured intelligence for each incident, in the order given.",
+        "input_schema": schema,
+    }
 
 
 class EvidenceEnricher:
@@ -103,28 +270,24 @@ class EvidenceEnricher:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        self.model = "claude-3-5-sonnet-20241022"
+        self.model = LLM_MODEL
 
-        # Import Anthropic client only if API key is available
-        if self.api_key:
-            try:
-                from anthropic import Anthropic
-                self.client = Anthropic(api_key=self.api_key)
-            except ImportError:
-                self.client = None
-        else:
-            self.client = None
+        # Anthropic client only if API key is available (shared across enrichers)
+        self.client = _get_client(self.api_key) if self.api_key else None
+        self.async_client = _get_async_client(self.api_key) if self.api_key else None
 
     def enrich_incident(
         self,
         incident_id: int,
         evidence_stack: Any,  # EvidenceStack from services.evidence_stack
+        use_cache: bool = True,
     ) -> EnrichedIncident:
         """Enrich incident with LLM analysis of evidence stack.
 
         Args:
             incident_id: ID of the incident
             evidence_stack: EvidenceStack with all collected evidence
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
             EnrichedIncident with extracted intelligence signals
@@ -136,137 +299,318 @@ class EvidenceEnricher:
         # Build prompt from evidence stack
         prompt = self._build_analysis_prompt(evidence_stack)
 
-        # Call LLM with function calling schema
-        response = self._call_llm(prompt)
+        # Identical prompt seen recently: reuse the response, skip the API call
+        cache_key = llm_cache.make_key(self.model, _ANALYSIS_SYSTEM_PROMPT, prompt)
+        response = llm_cache.get(cache_key) if use_cache else None
+        if response is None:
+            # Call LLM with function calling schema
+            response = self._call_llm(prompt)
+            if self._is_cacheable(response):
+                llm_cache.set(cache_key, response)
 
         # Parse structured response
         enriched = self._parse_llm_response(incident_id, response, evidence_stack)
 
         return enriched
 
-    def _build_analysis_prompt(self, evidence_stack: Any) -> str:
-        """Build analysis prompt from evidence stack.
+    async def enrich_incident_async(
+        self,
+        incident_id: int,
+        evidence_stack: Any,
+        use_cache: bool = True,
+    ) -> EnrichedIncident:
+        """Async enrich_incident for the API: the reply is streamed on the
+        event loop instead of holding a worker thread for the whole generation.
 
         Args:
-            evidence_stack: EvidenceStack with all evidence
+            incident_id: ID of the incident
+            evidence_stack: EvidenceStack with all collected evidence
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
-            Structured prompt for LLM
+            EnrichedIncident with extracted intelligence signals
         """
-        all_items = evidence_stack.all_items
-
-        # Group evidence by source type for clarity
-        evidence_by_type = {
-            "official_reports": evidence_stack.official_reports,
-            "news_articles": evidence_stack.news_articles,
-            "social_media": evidence_stack.social_media_posts,
-            "telegram": evidence_stack.telegram_messages,
-            "youtube": evidence_stack.youtube_videos,
-            "forums": evidence_stack.forum_posts,
-            "witnesses": evidence_stack.witness_statements,
-        }
+        if not self.async_client:
+            return self._mock_enrichment(incident_id, evidence_stack)
 
-        prompt = f"""You are an intelligence analyst specializing in drone/UAS incident analysis. Analyze the following OSINT evidence and extract structured intelligence signals.
+        prompt = self._build_analysis_prompt(evidence_stack)
 
-INCIDENT ID: {evidence_stack.incident_id}
-TOTAL EVIDENCE ITEMS: {evidence_stack.total_items}
-AVERAGE CREDIBILITY: {evidence_stack.avg_credibility:.2f}
+        # llm_cache is sync (psycopg2); keep its round trips off the loop
+        cache_key = llm_cache.make_key(self.model, _ANALYSIS_SYSTEM_PROMPT, prompt)
+        response = await asyncio.to_thread(llm_cache.get, cache_key) if use_cache else None
+        if response is None:
+            response = await self._call_llm_async(prompt)
+            if self._is_cacheable(response):
+                await asyncio.to_thread(llm_cache.set, cache_key, response)
 
-EVIDENCE BY SOURCE TYPE:
-"""
+        return self._parse_llm_response(incident_id, response, evidence_stack)
 
-        for source_type, items in evidence_by_type.items():
-            if items:
-                prompt += f"\n### {source_type.upper()} ({len(items)} items):\n"
-                for idx, item in enumerate(items, 1):
-                    prompt += f"\n{idx}. SOURCE: {item.source_name} (credibility: {item.credibility_score:.2f})\n"
-                    prompt += f"   PUBLISHED: {item.published_at or 'unknown'}\n"
-                    prompt += f"   TEXT: {item.text_content[:500]}...\n"
-                    if item.geoloc_cues:
-                        prompt += f"   LOCATION CUES: {', '.join(item.geoloc_cues)}\n"
-                    if item.temporal_cues:
-                        prompt += f"   TIME CUES: {', '.join(item.temporal_cues)}\n"
+    def _build_analysis_prompt(self, evidence_stack: Any) -> str:
+        """Build the per-incident part of the analysis prompt.
 
-        prompt += """
+        Provider prompt caches match on the longest identical prefix, so
+        everything static belongs in _ANALYSIS_SYSTEM_PROMPT (sent first);
+        only incident-specific content is rendered here, after it.
 
-ANALYSIS TASKS:
+        Args:
+            evidence_stack: EvidenceStack with all evidence
 
-1. DRONE TYPE SIGNALS
-   - What type of drone is most likely based on evidence?
-   - Consider: size descriptions, sound descriptions, flight characteristics, lighting
-   - Provide confidence score (0-1)
+        Returns:
+            Evidence prompt for the user message
+        """
+        parts = [_PROMPT_HEADER.format(
+            incident_id=evidence_stack.incident_id,
+            total_items=evidence_stack.total_items,
+            avg_credibility=evidence_stack.avg_credibility,
+        )]
+        append = parts.append
+        budgets = self._text_budgets(evidence_stack.all_items)
+
+        for label, attr in _PROMPT_SECTIONS:
+            items = getattr(evidence_stack, attr)
+            if not items:
+                continue
+            append(f"\n### {label} ({len(items)} items):\n")
+            for idx, item in enumerate(items, 1):
+                append(_PROMPT_ITEM.format(
+                    idx=idx,
+                    source_name=item.source_name,
+                    credibility=item.credibility_score,
+                    published=item.published_at or "unknown",
+                    text=item.text_content[:budgets[id(item)]],
+                ))
+                if item.geoloc_cues:
+                    append(f"   LOCATION CUES: {', '.join(item.geoloc_cues)}\n")
+                if item.temporal_cues:
+                    append(f"   TIME CUES: {', '.join(item.temporal_cues)}\n")
+
+        return "".join(parts)
+
+    @staticmethod
+    def _text_budgets(items: List[Any]) -> Dict[int, int]:
+        """Allocate evidence text characters across items (water-filling).
 
-2. FLIGHT DYNAMICS
-   - Approach direction (if mentioned)
-   - Exit direction (if mentioned)
-   - Flight pattern (hovering, circling, straight line, etc.)
-   - Speed estimate (slow, moderate, fast)
-   - Maneuverability (agile, steady, erratic)
+        Args:
+            items: Evidence items of one stack
 
-3. ALTITUDE RANGE
-   - Estimate minimum and maximum altitude in meters
-   - Provide reasoning based on evidence (visual angle, sound loudness, etc.)
-   - Confidence score (0-1)
+        Returns:
+            Character budget per item, keyed by id(item)
+        """
+        remaining = _PROMPT_TEXT_BUDGET_TOKENS * _CHARS_PER_TOKEN
+        budgets = {}
+        for item in items:
+            budgets[id(item)] = floor = min(len(item.text_content), _MIN_ITEM_CHARS)
+            remaining -= floor
+
+        for item in sorted(items, key=lambda i: i.credibility_score, reverse=True):
+            if remaining <= 0:
+                break
+            extra = min(min(len(item.text_content), _MAX_ITEM_CHARS) - budgets[id(item)], remaining)
+            if extra > 0:
+                budgets[id(item)] += extra
+                remaining -= extra
+
+        return budgets
 
-4. LIGHTING CONDITIONS
-   - Time of day (dawn, day, dusk, night)
-   - Visibility conditions
-   - Were lights/strobes observed?
-   - Light pattern description
+    def _call_llm(self, prompt: str) -> Dict[str, Any]:
+        """Call LLM API with structured prompting.
 
-5. EYEWITNESS CONFLICTS
-   - Are there conflicting accounts between different witnesses?
-   - What are the areas of disagreement?
-   - Can you resolve to a consensus view?
-   - Confidence in resolution
+        Args:
+            prompt: Per-incident evidence prompt (instructions go in the system block)
 
-ANTI-HALLUCINATION RULES:
-- ONLY extract information that is explicitly stated or strongly implied in the evidence
-- Mark uncertainty clearly when evidence is ambiguous
-- Do NOT invent details not present in the evidence
-- If conflicting accounts exist, acknowledge them rather than forcing consensus
-- Use lower confidence scores when evidence is weak or contradictory
+        Returns:
+            LLM response as dictionary
+        """
+        try:
+            message = self.client.messages.create(**self._request_params(prompt))
 
-OUTPUT FORMAT: Return a JSON object with the structure matching the EnrichedIncident schema.
-"""
+            # Forced tool call: arguments arrive as parsed, schema-shaped JSON
+            return self._tool_input(message)
 
-        return prompt
+        except Exception as e:
+            # Fallback: return error
+            return {"error": str(e)}
 
-    def _call_llm(self, prompt: str) -> Dict[str, Any]:
-        """Call LLM API with structured prompting.
+    async def _call_llm_async(self, prompt: str) -> Dict[str, Any]:
+        """Streaming counterpart of _call_llm.
 
         Args:
-            prompt: Analysis prompt
+            prompt: Per-incident evidence prompt (instructions go in the system block)
 
         Returns:
             LLM response as dictionary
         """
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                temperature=0.0,  # Low temperature for factual extraction
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            async with self.async_client.messages.stream(**self._request_params(prompt)) as stream:
+                message = await stream.get_final_message()
+            return self._tool_input(message)
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _request_params(self, prompt: str, tool: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Messages API parameters for one analysis call.
+
+        Args:
+            prompt: Per-incident evidence prompt
+            tool: Tool the model must answer through (defaults to record_enrichment)
+
+        Returns:
+            Keyword arguments for messages.create (also used as batch request params)
+        """
+        tool = tool or _enrichment_tool()
+        return {
+            "model": self.model,
+            "max_tokens": 4096,
+            "temperature": 0.0,  # Low temperature for factual extraction
+            # Tools precede the system block, so the schema is part of the cached prefix
+            "tools": [tool],
+            "tool_choice": {"type": "tool", "name": tool["name"]},
+            "system": _ANALYSIS_SYSTEM_BLOCKS,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+        }
+
+    @staticmethod
+    def _is_cacheable(response: Dict[str, Any]) -> bool:
+        """Only structured, successful responses are worth caching."""
+        return "error" not in response
+
+    @staticmethod
+    def _tool_input(message: Any) -> Dict[str, Any]:
+        """Arguments of the forced tool call in a Messages API response."""
+        for block in message.content:
+            if block.type == "tool_use":
+                return block.input
+        return {"error": f"no tool call in response (stop_reason={message.stop_reason})"}
+
+    def enrich_incidents_batch(
+        self,
+        pairs: List[Tuple[int, Any]],
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0,
+    ) -> List[EnrichedIncident]:
+        """Enrich many incidents through the Message Batches API.
+
+        Batched requests are billed at half the input-token rate but complete
+        asynchronously (usually within an hour, at most 24h), so this is for
+        offline backlogs, not request handlers. Blocks until the batch ends.
+
+        Args:
+            pairs: (incident_id, EvidenceStack) tuples
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Upper bound for the exponential backoff
+
+        Returns:
+            EnrichedIncident per input pair, in input order
+        """
+        if not self.client:
+            return [self._mock_enrichment(incident_id, stack) for incident_id, stack in pairs]
+
+        # Prompts with a cached response are not resubmitted
+        responses: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, Tuple[str, str]] = {}  # custom_id -> (prompt, cache key)
+        for incident_id, stack in pairs:
+            prompt = self._build_analysis_prompt(stack)
+            cache_key = llm_cache.make_key(self.model, _ANALYSIS_SYSTEM_PROMPT, prompt)
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                responses[str(incident_id)] = cached
+            else:
+                pending[str(incident_id)] = (prompt, cache_key)
+
+        if pending:
+            batch = self.client.messages.batches.create(requests=[
+                {"custom_id": custom_id, "params": self._request_params(prompt)}
+                for custom_id, (prompt, _) in pending.items()
+            ])
+
+            # Exponential backoff until every request has finished
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    response = self._tool_input(entry.result.message)
+                    if self._is_cacheable(response) and entry.custom_id in pending:
+                        llm_cache.set(pending[entry.custom_id][1], response)
+                else:
+                    response = {"error": f"batch request {entry.result.type}"}
+                responses[entry.custom_id] = response
+
+        return [
+            self._parse_llm_response(
+                incident_id,
+                responses.get(str(incident_id), {"error": "missing from batch results"}),
+                stack,
             )
+            for incident_id, stack in pairs
+        ]
 
-            # Extract text content
-            response_text = message.content[0].text
+    def enrich_incidents_grouped(
+        self,
+        pairs: List[Tuple[int, Any]],
+        batch_size: int = 4,
+    ) -> List[EnrichedIncident]:
+        """Enrich several incidents per API call (batch prompting).
 
-            # Try to parse as JSON
-            try:
-                return json.loads(response_text)
-            except json.JSONDecodeError:
-                # If not valid JSON, return as text
-                return {"raw_text": response_text}
+        Each call carries the instructions once and the evidence of up to
+        batch_size incidents, and has the model record one entry per incident
+        through the record_enrichments tool. Groups follow input order. A group
+        whose answer is not a list of the right length falls back to one call
+        per incident.
 
-        except Exception as e:
-            # Fallback: return error
-            return {"error": str(e)}
+        Args:
+            pairs: (incident_id, EvidenceStack) tuples
+            batch_size: Incidents per call
+
+        Returns:
+            EnrichedIncident per input pair, in input order
+        """
+        if not self.client:
+            return [self._mock_enrichment(incident_id, stack) for incident_id, stack in pairs]
+
+        results: List[EnrichedIncident] = []
+        for start in range(0, len(pairs), batch_size):
+            group = pairs[start:start + batch_size]
+            if len(group) == 1:
+                results.append(self.enrich_incident(*group[0]))
+                continue
+
+            parts = [
+                f"=== INCIDENT[{idx}] ===\n{self._build_analysis_prompt(stack)}"
+                for idx, (_, stack) in enumerate(group, 1)
+            ]
+            parts.append(
+                f"Analyze each of the {len(group)} incidents above independently. "
+                "Record one entry per incident in the order given (INCIDENT[1] first)."
+            )
+
+            params = self._request_params("\n\n".join(parts), tool=_grouped_enrichment_tool())
+            params["max_tokens"] = min(4096 * len(group), 8192)
+            try:
+                message = self.client.messages.create(**params)
+                responses = self._tool_input(message).get("incidents")
+            except Exception as e:
+                responses = {"error": str(e)}
+
+            if isinstance(responses, list) and len(responses) == len(group):
+                results.extend(
+                    self._parse_llm_response(incident_id, response, stack)
+                    if isinstance(response, dict)
+                    else self.enrich_incident(incident_id, stack)
+                    for (incident_id, stack), response in zip(group, responses)
+                )
+            else:
+                results.extend(self.enrich_incident(incident_id, stack) for incident_id, stack in group)
+
+        return results
 
     def _parse_llm_response(
         self,
@@ -286,54 +630,36 @@ OUTPUT FORMAT: Return a JSON object with the structure matching the EnrichedInci
         """
         # Handle error responses
         if "error" in response:
-            return EnrichedIncident(
-                incident_id=incident_id,
-                intelligence_summary=f"LLM enrichment failed: {response['error']}",
-                key_findings=["Analysis unavailable due to LLM error"],
-                total_evidence_analyzed=evidence_stack.total_items
+            return self._failed_enrichment(incident_id, evidence_stack, response["error"])
+
+        # Tool input follows the EnrichedIncident schema: validate it in one pass,
+        # adding the fields the pipeline owns
+        try:
+            return _ENRICHED_ADAPTER.validate_python({
+                "intelligence_summary": "No summary available",
+                **response,
+                "incident_id": incident_id,
+                "llm_model": self.model,
+                "total_evidence_analyzed": evidence_stack.total_items,
+                "enrichment_failed": False,
+            })
+        except ValidationError as e:
+            return self._failed_enrichment(
+                incident_id, evidence_stack, f"{e.error_count()} invalid field(s) in response"
             )
 
-        # Parse drone type signals
-        drone_types = []
-        if "drone_type_signals" in response:
-            for signal in response["drone_type_signals"]:
-                try:
-                    drone_types.append(DroneTypeSignal(signal))
-                except ValueError:
-                    pass
-
-        # Parse flight dynamics
-        flight_dynamics = None
-        if "flight_dynamics" in response and response["flight_dynamics"]:
-            flight_dynamics = FlightDynamics(**response["flight_dynamics"])
-
-        # Parse altitude range
-        altitude_range = None
-        if "altitude_range" in response and response["altitude_range"]:
-            altitude_range = AltitudeRange(**response["altitude_range"])
-
-        # Parse lighting conditions
-        lighting = None
-        if "lighting_conditions" in response and response["lighting_conditions"]:
-            lighting = LightingConditions(**response["lighting_conditions"])
-
-        # Parse eyewitness conflicts
-        conflicts = None
-        if "eyewitness_conflicts" in response and response["eyewitness_conflicts"]:
-            conflicts = EyewitnessConflicts(**response["eyewitness_conflicts"])
+    @staticmethod
+    def _failed_enrichment(incident_id: int, evidence_stack: Any, error: str) -> EnrichedIncident:
+        """EnrichedIncident placeholder for a failed or unusable LLM response.
 
+        Marked enrichment_failed, so results built from it are not cached.
+        """
         return EnrichedIncident(
             incident_id=incident_id,
-            drone_type_signals=drone_types,
-            drone_type_confidence=response.get("drone_type_confidence", 0.0),
-            flight_dynamics=flight_dynamics,
-            altitude_range=altitude_range,
-            lighting_conditions=lighting,
-            eyewitness_conflicts=conflicts,
-            intelligence_summary=response.get("intelligence_summary", "No summary available"),
-            key_findings=response.get("key_findings", []),
+            intelligence_summary=f"LLM enrichment failed: {error}",
+            key_findings=["Analysis unavailable due to LLM error"],
             total_evidence_analyzed=evidence_stack.total_items,
-            llm_model=self.model
+            enrichment_failed=True,
         )
 
     def _mock_enrichment(self, incident_id: int, evidence_stack: Any) -> EnrichedIncident:
@@ -361,16 +687,62 @@ OUTPUT FORMAT: Return a JSON object with the structure matching the EnrichedInci
         )
 
 
+def enrichment_mode() -> Tuple[str, bool]:
+    """Model and mode that enrich_incident would use right now.
+
+    Enrichment is live only with an API key and the Anthropic SDK installed;
+    otherwise it falls back to the mock. Caches of enriched results key on
+    this so they do not outlive a model or mode change.
+
+    Returns:
+        (llm_model, live) - llm_model is "mock" when not live
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    live = bool(api_key) and _get_client(api_key) is not None
+    return (LLM_MODEL if live else "mock"), live
+
+
 # Factory function for easy instantiation
-def enrich_incident(incident_id: int, evidence_stack: Any) -> EnrichedIncident:
+def enrich_incident(incident_id: int, evidence_stack: Any, use_cache: bool = True) -> EnrichedIncident:
     """Enrich incident with LLM analysis.
 
     Args:
         incident_id: ID of the incident
         evidence_stack: EvidenceStack with all evidence
+        use_cache: Reuse a cached response for an identical prompt
+
+    Returns:
+        EnrichedIncident with extracted intelligence signals
+    """
+    enricher = EvidenceEnricher()
+    return enricher.enrich_incident(incident_id, evidence_stack, use_cache=use_cache)
+
+
+async def enrich_incident_async(
+    incident_id: int, evidence_stack: Any, use_cache: bool = True
+) -> EnrichedIncident:
+    """Enrich incident with LLM analysis without blocking the event loop.
+
+    Args:
+        incident_id: ID of the incident
+        evidence_stack: EvidenceStack with all evidence
+        use_cache: Reuse a cached response for an identical prompt
 
     Returns:
         EnrichedIncident with extracted intelligence signals
     """
     enricher = EvidenceEnricher()
-    return enricher.enrich_incident(incident_id, evidence_stack)
+    return await enricher.enrich_incident_async(incident_id, evidence_stack, use_cache=use_cache)
+
+
+def enrich_incidents_batch(pairs: List[Tuple[int, Any]]) -> List[EnrichedIncident]:
+    """Enrich a backlog of incidents via the Message Batches API (blocking).
+
+    Args:
+        pairs: (incident_id, EvidenceStack) tuples
+
+    Returns:
+        EnrichedIncident per input pair, in input order
+    """
+    enricher = EvidenceEnricher()
+    return enricher.enrich_incidents_batch(pairs)
@@ -0,0 +1,104 @@
+"""LLM Response Cache - Content-addressed store for model responses.
+
+Re-analyzing an unchanged evidence stack (retries, UI refreshes, recomputes)
+renders the exact same prompt, so the parsed response is stored under the
+SHA-256 of model + system prompt + user prompt and reused until it expires.
+This skips the API call entirely, on top of provider-side prefix caching.
+
+Enrichment runs in a worker thread, so the cache uses its own small sync
+(psycopg2) engine rather than the API's async one. Cache failures are logged
+and treated as misses; they never fail an enrichment.
+
+Architecture Layer: llm/
+Dependencies: domain.llm_cache_entry, config
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+import hashlib
+import logging
+import threading
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from backend.app.config import settings
+from backend.app.domain.llm_cache_entry import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine() -> Engine:
+    """Create the cache engine on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    settings.DATABASE_URL,
+                    pool_pre_ping=True,
+                    pool_size=2,
+                    max_overflow=2,
+                )
+    return _engine
+
+
+def make_key(model: str, system_prompt: str, prompt: str) -> str:
+    """SHA-256 hex digest identifying one rendered LLM request.
+
+    Args:
+        model: Model name
+        system_prompt: Static system instructions
+        prompt: Per-incident user prompt
+
+    Returns:
+        64-character hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, prompt):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached response for key, or None if missing, expired or disabled."""
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+
+    try:
+        with Session(_get_engine()) as session:
+            return session.scalar(
+                select(LLMCacheEntry.response)
+                .where(LLMCacheEntry.key == key)
+                .where(LLMCacheEntry.expires_at > datetime.now(timezone.utc))
+            )
+    except SQLAlchemyError as e:
+        logger.warning(f"LLM cache lookup failed: {e}")
+        return None
+
+
+def set(key: str, response: Dict[str, Any], ttl: Optional[timedelta] = None) -> None:
+    """Store response under key (upsert).
+
+    Args:
+        key: Key from make_key
+        response: Parsed model response
+        ttl: Lifetime (defaults to LLM_CACHE_TTL_DAYS)
+    """
+    if not settings.LLM_CACHE_ENABLED:
+        return
+
+    ttl = ttl if ttl is not None else timedelta(days=settings.LLM_CACHE_TTL_DAYS)
+    try:
+        with Session(_get_engine()) as session:
+            session.merge(LLMCacheEntry(
+                key=key,
+                response=response,
+                expires_at=datetime.now(timezone.utc) + ttl,
+            ))
+            session.commit()
+    except SQLAlchemyError as e:
+        logger.warning(f"LLM cache store failed: {e}")
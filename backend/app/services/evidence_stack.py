@@ -7,10 +7,49 @@ Architecture Layer: services/
 Dependencies: domain.evidence, external OSINT APIs (future)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, NamedTuple, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from itertools import chain
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
+import re
+import statistics
+import zlib
+from backend.app.services.process_pool import get_process_pool
+
+
+# Near-duplicate detection: one-permutation MinHash over word 3-shingles.
+# Each shingle is hashed once; its low bits pick one of 64 bins and the rest
+# compete for that bin's minimum. Bins are bucketed by LSH bands (8 bands x
+# 8 rows) so each record is only compared with bucket mates, then confirmed
+# by estimated Jaccard.
+_SHINGLE_SIZE = 3
+_MINHASH_BINS = 64
+_MINHASH_BIN_BITS = 6
+_EMPTY_BIN = -1
+_LSH_ROWS_PER_BAND = 8
+_NEAR_DUPLICATE_THRESHOLD = 0.85
+
+# Keyword indicators matched against lowercased evidence text. List order is
+# cue priority: extraction stops once _MAX_CUES cues have been found.
+_LOCATION_INDICATORS = (
+    "airport", "luchthaven", "base", "basis",
+    "near", "bij", "vlakbij", "nabij",
+    "kilometers from", "km van",
+)
+_TIME_INDICATORS = (
+    "night", "nacht", "evening", "avond",
+    "morning", "ochtend", "afternoon", "middag",
+    "yesterday", "gisteren", "today", "vandaag",
+    "at", "om", "around", "ongeveer",
+)
+_DISINFO_INDICATORS = (
+    "hoax", "fake", "false flag", "conspiracy",
+    "coverup", "cover-up", "government lies",
+    "mainstream media", "msm", "propaganda",
+)
+_MAX_CUES = 5
 
 
 class EvidenceSourceClassification(str, Enum):
@@ -26,10 +65,131 @@ class EvidenceSourceClassification(str, Enum):
     YOUTUBE_VIDEO = "youtube_video"  # YouTube content
     UNKNOWN = "unknown"
 
+    def __new__(cls, value: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        # Dense 0..n-1 index in definition order, for tuple-indexed tables
+        member.code = len(cls.__members__)
+        return member
+
+
+# Evidence.SourceType value -> classification (unlisted types are UNKNOWN)
+_TYPE_MAP = {
+    "official_report": EvidenceSourceClassification.OFFICIAL_REPORT,
+    "news": EvidenceSourceClassification.VERIFIED_NEWS,
+    "social_media": EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED,
+    "telegram": EvidenceSourceClassification.TELEGRAM_CHANNEL,
+    "reddit": EvidenceSourceClassification.FORUM_POST,
+    "forum": EvidenceSourceClassification.FORUM_POST,
+}
+
+# Base credibility by classification
+_CREDIBILITY_MAP = {
+    EvidenceSourceClassification.OFFICIAL_REPORT: 0.95,
+    EvidenceSourceClassification.VERIFIED_NEWS: 0.85,
+    EvidenceSourceClassification.LOCAL_NEWS: 0.80,
+    EvidenceSourceClassification.SOCIAL_MEDIA_VERIFIED: 0.70,
+    EvidenceSourceClassification.WITNESS_STATEMENT: 0.65,
+    EvidenceSourceClassification.TELEGRAM_CHANNEL: 0.55,
+    EvidenceSourceClassification.FORUM_POST: 0.50,
+    EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED: 0.40,
+    EvidenceSourceClassification.YOUTUBE_VIDEO: 0.45,
+    EvidenceSourceClassification.UNKNOWN: 0.30,
+}
+
+# Classification -> EvidenceStack list attribute (unlisted go to news_articles)
+_CATEGORY_ATTR_MAP = {
+    EvidenceSourceClassification.OFFICIAL_REPORT: "official_reports",
+    EvidenceSourceClassification.VERIFIED_NEWS: "news_articles",
+    EvidenceSourceClassification.LOCAL_NEWS: "news_articles",
+    EvidenceSourceClassification.SOCIAL_MEDIA_VERIFIED: "social_media_posts",
+    EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED: "social_media_posts",
+    EvidenceSourceClassification.TELEGRAM_CHANNEL: "telegram_messages",
+    EvidenceSourceClassification.YOUTUBE_VIDEO: "youtube_videos",
+    EvidenceSourceClassification.FORUM_POST: "forum_posts",
+    EvidenceSourceClassification.WITNESS_STATEMENT: "witness_statements",
+}
+
+# The per-item lookups above as tuples indexed by classification.code
+# (plain indexing, no hashing of the enum member)
+_CREDIBILITY_TABLE = tuple(_CREDIBILITY_MAP.get(c, 0.5) for c in EvidenceSourceClassification)
+_CATEGORY_ATTR_TABLE = tuple(_CATEGORY_ATTR_MAP.get(c, "news_articles") for c in EvidenceSourceClassification)
+
+# Matched against the lowercased source name
+_LOCAL_SOURCE_INDICATORS = ("local", "lokaal", "regional", "gemeente")
+# One C-level scan instead of a generator over the indicators (the name is
+# already lowercased, so no re.IGNORECASE, which measured slower)
+_LOCAL_SOURCE_RE = re.compile("|".join(map(re.escape, _LOCAL_SOURCE_INDICATORS)))
+_SUSPICIOUS_SOURCE_PATTERNS = ("anon", "truth", "patriot", "awakened", "woke")
+
+
+def _adversary_score_table() -> Tuple[Tuple[float, ...], ...]:
+    """Adversary intent score indexed by [disinfo hits][suspicious name hits].
+
+    Built with the same running float additions the per-record loop used,
+    so lookups return bit-identical scores.
+    """
+    table = []
+    for disinfo_hits in range(len(_DISINFO_INDICATORS) + 1):
+        row = []
+        for suspicious_hits in range(len(_SUSPICIOUS_SOURCE_PATTERNS) + 1):
+            score = 0.0
+            for _ in range(disinfo_hits):
+                score += 0.15
+            for _ in range(suspicious_hits):
+                score += 0.10
+            row.append(min(1.0, score))
+        table.append(tuple(row))
+    return tuple(table)
+
+
+# Scores reduce to a few integer/boolean signals per record, so they are
+# precomputed once and looked up instead of recomputed for every record
+_ADVERSARY_SCORES = _adversary_score_table()
+# Per suspicious-name hit count: disinfo hits at which the score saturates
+# at 1.0, so counting can stop there
+_DISINFO_SATURATION = tuple(
+    next((d for d, row in enumerate(_ADVERSARY_SCORES) if row[s] >= 1.0), len(_DISINFO_INDICATORS) + 1)
+    for s in range(len(_SUSPICIOUS_SOURCE_PATTERNS) + 1)
+)
+_LOCALITY_SCORES = {  # (local source, has geographic cues) -> score
+    (False, False): 0.5,
+    (False, True): min(1.0, 0.5 + 0.2),
+    (True, False): min(1.0, 0.5 + 0.3),
+    (True, True): min(1.0, 0.5 + 0.3 + 0.2),
+}
+
+
+class _SourceProfile(NamedTuple):
+    """Signals that depend only on the source, not on the evidence text."""
+    classification: EvidenceSourceClassification
+    is_local: bool
+    suspicious_hits: int
+
+
+@lru_cache(maxsize=4096)
+def _source_profile(source_type: Any, name_lower: str) -> _SourceProfile:
+    """Classify a source and scan its name, memoized per (type, name).
+
+    Many records share a source (hundreds of posts from one channel), so
+    each distinct source is classified and pattern-matched only once.
+    """
+    classification = _TYPE_MAP.get(source_type, EvidenceSourceClassification.UNKNOWN)
+    is_local = _LOCAL_SOURCE_RE.search(name_lower) is not None
+
+    # Upgrade news from a local source
+    if classification is EvidenceSourceClassification.VERIFIED_NEWS and is_local:
+        classification = EvidenceSourceClassification.LOCAL_NEWS
+
+    suspicious_hits = sum(pattern in name_lower for pattern in _SUSPICIOUS_SOURCE_PATTERNS)
+    return _SourceProfile(classification, is_local, suspicious_hits)
+
 
 class EvidenceItem(BaseModel):
     """Single piece of evidence with scoring and metadata."""
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     source_id: str = Field(..., description="Unique identifier for this evidence (URL or hash)")
     source_type: EvidenceSourceClassification
     source_name: str = Field(..., description="Name of source (e.g., 'NOS', 'Twitter User @foo')")
@@ -56,6 +216,12 @@ class EvidenceItem(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata (hashtags, engagement, etc.)")
 
 
+# The builder sets every field, so all its items can share one fields-set
+# instead of each carrying its own (about half the per-item overhead). Safe
+# because items are frozen: model_copy() copies the set before updating it.
+_ITEM_FIELDS_SET = set(EvidenceItem.model_fields)
+
+
 class EvidenceStack(BaseModel):
     """Aggregated and deduplicated evidence stack for an incident.
 
@@ -85,18 +251,118 @@ class EvidenceStack(BaseModel):
     # Collection metadata
     collected_at: datetime = Field(default_factory=datetime.utcnow)
 
+    def iter_items(self) -> Iterator[EvidenceItem]:
+        """Iterate all evidence items in category order without copying them."""
+        return chain(
+            self.official_reports,
+            self.news_articles,
+            self.social_media_posts,
+            self.telegram_messages,
+            self.youtube_videos,
+            self.forum_posts,
+            self.witness_statements,
+        )
+
     @property
     def all_items(self) -> List[EvidenceItem]:
-        """Return all evidence items combined."""
-        return (
-            self.official_reports +
-            self.news_articles +
-            self.social_media_posts +
-            self.telegram_messages +
-            self.youtube_videos +
-            self.forum_posts +
-            self.witness_statements
-        )
+        """Return all evidence items combined (a new list, built in one pass)."""
+        return list(self.iter_items())
+
+
+class _NearDuplicateIndex:
+    """MinHash LSH index of the texts seen so far in one stack build.
+
+    Catches reposts and mirrored articles that exact URL/content matching
+    misses. Shingles are hashed with CRC-32 rather than the per-process
+    randomized str hash, so every worker deduplicates the same evidence
+    the same way.
+    """
+
+    def __init__(self, threshold: float = _NEAR_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self._signatures: List[Tuple[int, ...]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    @staticmethod
+    def signature(text: Optional[str]) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of text (None for empty text). Pure, so it can be
+        computed in a worker process."""
+        tokens = (text or "").lower().split()
+        if not tokens:
+            return None
+        shingles = {
+            " ".join(tokens[i:i + _SHINGLE_SIZE])
+            for i in range(max(1, len(tokens) - _SHINGLE_SIZE + 1))
+        }
+        bins = [_EMPTY_BIN] * _MINHASH_BINS
+        for shingle in shingles:
+            h = zlib.crc32(shingle.encode())
+            b = h & (_MINHASH_BINS - 1)
+            value = h >> _MINHASH_BIN_BITS
+            if bins[b] == _EMPTY_BIN or value < bins[b]:
+                bins[b] = value
+        return tuple(bins)
+
+    def add(self, signature: Optional[Tuple[int, ...]]) -> bool:
+        """Index a text's signature unless it near-duplicates an indexed one.
+
+        Args:
+            signature: Result of signature() for the text
+
+        Returns:
+            True if the text is a near-duplicate (not indexed), False otherwise
+        """
+        if signature is None:
+            return False
+
+        # Bands with no filled bin (short texts) would put every short text
+        # in one bucket, so they are not indexed
+        keys = [
+            (band, signature[start:start + _LSH_ROWS_PER_BAND])
+            for band, start in enumerate(range(0, _MINHASH_BINS, _LSH_ROWS_PER_BAND))
+        ]
+        keys = [key for key in keys if any(v != _EMPTY_BIN for v in key[1])]
+        candidates = {idx for key in keys for idx in self._buckets.get(key, ())}
+        for idx in candidates:
+            other = self._signatures[idx]
+            # Jaccard estimate over the bins either text fills
+            filled = matches = 0
+            for x, y in zip(signature, other):
+                if x != _EMPTY_BIN or y != _EMPTY_BIN:
+                    filled += 1
+                    matches += x == y
+            if matches >= self.threshold * filled:
+                return True
+
+        idx = len(self._signatures)
+        self._signatures.append(signature)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(idx)
+        return False
+
+
+# Signature and item creation (cue extraction + scoring) are pure per record
+# and take a fraction of a millisecond each, hence the high threshold
+_PARALLEL_MIN_RECORDS = 500
+_PARALLEL_CHUNK_SIZE = 256
+
+
+class _RecordFields(NamedTuple):
+    """The Evidence columns per-record analysis reads, detached from the ORM
+    session so they can be pickled to a worker."""
+    id: Optional[int]
+    url: Optional[str]
+    source_type: Any
+    source_name: Optional[str]
+    raw_text: Optional[str]
+    language: Optional[str]
+    published_at: Optional[datetime]
+    meta: Optional[Dict[str, Any]]
+
+
+def _analyze_chunk(records: List[_RecordFields]) -> List[Tuple[Optional[Tuple[int, ...]], "EvidenceItem"]]:
+    """Worker entry point: signature and item for each record of one chunk."""
+    return EvidenceStackBuilder()._analyze_records(records)
 
 
 class EvidenceStackBuilder:
@@ -129,28 +395,85 @@ class EvidenceStackBuilder:
         Returns:
             EvidenceStack with categorized and scored evidence
         """
-        stack = EvidenceStack(incident_id=incident_id)
-        seen_sources = set()  # For deduplication
-
-        for record in evidence_records:
-            # Deduplicate by URL or content hash
-            source_id = record.url or f"hash_{hash(record.raw_text)}"
-            if source_id in seen_sources:
+        # Starts empty; only _categorize_item and _calculate_statistics fill
+        # it in, from EvidenceItems this builder created itself
+        stack = EvidenceStack.model_construct(incident_id=incident_id)
+
+        # Deduplicate by URL or content hash (cheap exact pre-filter)
+        unique_records = self._drop_exact_duplicates(evidence_records)
+        stack.duplicates_removed = len(evidence_records) - len(unique_records)
+
+        # Statistics accumulated in the same pass that categorizes items, so
+        # the aggregates need neither all_items nor further passes
+        credibility_scores: List[float] = []
+
+        # Signatures and items may come from worker processes; the LSH index
+        # itself is order-dependent and stays sequential
+        near_duplicates = _NearDuplicateIndex()
+        for signature, item in self._analyze_batch(unique_records):
+            # Then by content similarity (reposts, mirrored articles)
+            if near_duplicates.add(signature):
                 stack.duplicates_removed += 1
                 continue
-            seen_sources.add(source_id)
 
-            # Create evidence item
-            item = self._create_evidence_item(record)
-
-            # Categorize by source type
+            # Categorize by source type (also extends the temporal bounds)
             self._categorize_item(stack, item)
+            credibility_scores.append(item.credibility_score)
 
         # Calculate aggregate statistics
-        self._calculate_statistics(stack)
+        self._calculate_statistics(stack, credibility_scores)
 
         return stack
 
+    @staticmethod
+    def _drop_exact_duplicates(records: List[Any]) -> List[Any]:
+        """Records whose URL (or text, if no URL) has not been seen before.
+
+        Keys are the strings themselves, tagged by kind so a URL never matches
+        a text: hashes alone could collide and silently drop distinct
+        evidence. The set only references strings the records already hold,
+        and is released on return rather than held through the much longer
+        analysis phase.
+        """
+        seen_sources: Set[Tuple[str, Optional[str]]] = set()
+        unique_records = []
+        for record in records:
+            source_key = ("url", record.url) if record.url else ("text", record.raw_text)
+            if source_key not in seen_sources:
+                seen_sources.add(source_key)
+                unique_records.append(record)
+        return unique_records
+
+    def _analyze_records(self, records: List[Any]) -> List[Tuple[Optional[Tuple[int, ...]], EvidenceItem]]:
+        """MinHash signature and scored item for each record, in order."""
+        return [
+            (_NearDuplicateIndex.signature(record.raw_text), self._create_evidence_item(record))
+            for record in records
+        ]
+
+    def _analyze_batch(self, records: List[Any]) -> List[Tuple[Optional[Tuple[int, ...]], EvidenceItem]]:
+        """_analyze_records, spread over worker processes for large batches.
+
+        Args:
+            records: Evidence ORM objects that passed exact deduplication
+
+        Returns:
+            (signature, EvidenceItem) per record, in input order
+        """
+        if len(records) < _PARALLEL_MIN_RECORDS:
+            return self._analyze_records(records)
+
+        fields = [
+            _RecordFields(r.id, r.url, r.source_type, r.source_name,
+                          r.raw_text, r.language, r.published_at, r.meta)
+            for r in records
+        ]
+        chunks = [
+            fields[start:start + _PARALLEL_CHUNK_SIZE]
+            for start in range(0, len(fields), _PARALLEL_CHUNK_SIZE)
+        ]
+        return [pair for chunk in get_process_pool().map(_analyze_chunk, chunks) for pair in chunk]
+
     def _create_evidence_item(self, record: Any) -> EvidenceItem:
         """Convert database Evidence record to EvidenceItem with scoring.
 
@@ -160,24 +483,31 @@ class EvidenceStackBuilder:
         Returns:
             Scored EvidenceItem
         """
-        # Map source_type enum to classification
-        classification = self._classify_source(record.source_type, record.source_name)
+        # Normalize once; every helper below works on these
+        text = record.raw_text or ""
+        text_lower = text.lower()
+        name_lower = (record.source_name or "").lower()
+
+        # Map source_type enum to classification (plus the name-based signals)
+        source = _source_profile(record.source_type, name_lower)
+        classification = source.classification
 
         # Extract cues from text
-        geoloc_cues = self._extract_geoloc_cues(record.raw_text or "")
-        temporal_cues = self._extract_temporal_cues(record.raw_text or "")
+        geoloc_cues = self._extract_geoloc_cues(text, text_lower)
+        temporal_cues = self._extract_temporal_cues(text, text_lower)
 
         # Calculate scores
         credibility = self._calculate_credibility(classification, record.source_name)
-        locality = self._calculate_locality(record.source_name, geoloc_cues)
-        adversary_intent = self._calculate_adversary_intent(record.raw_text or "", record.source_name)
+        locality = self._calculate_locality(source.is_local, geoloc_cues)
+        adversary_intent = self._calculate_adversary_intent(text_lower, source.suspicious_hits)
 
-        return EvidenceItem(
+        return EvidenceItem.model_construct(
+            _ITEM_FIELDS_SET,
             source_id=record.url or f"evidence_{record.id}",
             source_type=classification,
             source_name=record.source_name or "Unknown",
             title=None,  # Future: extract from metadata
-            text_content=record.raw_text or "",
+            text_content=text,
             language=record.language or "en",
             published_at=record.published_at,
             collected_at=datetime.utcnow(),
@@ -189,93 +519,50 @@ class EvidenceStackBuilder:
             metadata=record.meta or {}
         )
 
-    def _classify_source(self, source_type: str, source_name: Optional[str]) -> EvidenceSourceClassification:
-        """Classify evidence source into reliability category.
+    @staticmethod
+    def _keyword_contexts(
+        text: str, text_lower: str, indicators: Tuple[str, ...], before: int, after: int
+    ) -> List[str]:
+        """Context snippets around the first occurrence of each indicator.
 
-        Args:
-            source_type: Source type from Evidence.source_type enum
-            source_name: Name of the source
-
-        Returns:
-            EvidenceSourceClassification
+        One find() per indicator (no separate membership test), stopping at
+        _MAX_CUES snippets.
         """
-        # Map Evidence.SourceType to EvidenceSourceClassification
-        type_map = {
-            "official_report": EvidenceSourceClassification.OFFICIAL_REPORT,
-            "news": EvidenceSourceClassification.VERIFIED_NEWS,
-            "social_media": EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED,
-            "telegram": EvidenceSourceClassification.TELEGRAM_CHANNEL,
-            "reddit": EvidenceSourceClassification.FORUM_POST,
-            "forum": EvidenceSourceClassification.FORUM_POST,
-        }
-
-        classification = type_map.get(source_type, EvidenceSourceClassification.UNKNOWN)
-
-        # Upgrade classification based on source name
-        if source_name and classification == EvidenceSourceClassification.VERIFIED_NEWS:
-            # Check if it's a local news source
-            local_indicators = ["lokaal", "local", "regional", "gemeente"]
-            if any(indicator in source_name.lower() for indicator in local_indicators):
-                classification = EvidenceSourceClassification.LOCAL_NEWS
-
-        return classification
-
-    def _extract_geoloc_cues(self, text: str) -> List[str]:
+        contexts = []
+        for indicator in indicators:
+            idx = text_lower.find(indicator)
+            if idx != -1:
+                contexts.append(text[max(0, idx - before):idx + after].strip())
+                if len(contexts) == _MAX_CUES:
+                    break
+        return contexts
+
+    def _extract_geoloc_cues(self, text: str, text_lower: str) -> List[str]:
         """Extract geographic location cues from text.
 
         Args:
             text: Raw text content
+            text_lower: text.lower()
 
         Returns:
-            List of location mentions
+            List of location mentions (at most 5)
         """
-        # Simple keyword extraction (Future: use NER)
-        geoloc_keywords = []
-
-        # Dutch/English location indicators
-        location_indicators = [
-            "airport", "luchthaven", "base", "basis",
-            "near", "bij", "vlakbij", "nabij",
-            "kilometers from", "km van"
-        ]
-
-        text_lower = text.lower()
-        for indicator in location_indicators:
-            if indicator in text_lower:
-                # Extract context around indicator (simple implementation)
-                idx = text_lower.index(indicator)
-                context = text[max(0, idx-20):min(len(text), idx+50)]
-                geoloc_keywords.append(context.strip())
-
-        return geoloc_keywords[:5]  # Limit to top 5
+        # Simple keyword extraction. Future: use NER (GPE/LOC/FAC entities),
+        # run once over the whole batch in build_stack (e.g. spaCy nlp.pipe)
+        # and passed in, rather than loading a pipeline per record here
+        return self._keyword_contexts(text, text_lower, _LOCATION_INDICATORS, 20, 50)
 
-    def _extract_temporal_cues(self, text: str) -> List[str]:
+    def _extract_temporal_cues(self, text: str, text_lower: str) -> List[str]:
         """Extract temporal cues from text.
 
         Args:
             text: Raw text content
+            text_lower: text.lower()
 
         Returns:
-            List of time-related mentions
+            List of time-related mentions (at most 5)
         """
-        temporal_keywords = []
-
-        # Temporal indicators
-        time_indicators = [
-            "night", "nacht", "evening", "avond",
-            "morning", "ochtend", "afternoon", "middag",
-            "yesterday", "gisteren", "today", "vandaag",
-            "at", "om", "around", "ongeveer"
-        ]
-
-        text_lower = text.lower()
-        for indicator in time_indicators:
-            if indicator in text_lower:
-                idx = text_lower.index(indicator)
-                context = text[max(0, idx-10):min(len(text), idx+30)]
-                temporal_keywords.append(context.strip())
-
-        return temporal_keywords[:5]
+        return self._keyword_contexts(text, text_lower, _TIME_INDICATORS, 10, 30)
 
     def _calculate_credibility(self, classification: EvidenceSourceClassification, source_name: str) -> float:
         """Calculate credibility score based on source classification.
@@ -287,78 +574,42 @@ class EvidenceStackBuilder:
         Returns:
             Credibility score (0-1)
         """
-        # Base credibility by classification
-        credibility_map = {
-            EvidenceSourceClassification.OFFICIAL_REPORT: 0.95,
-            EvidenceSourceClassification.VERIFIED_NEWS: 0.85,
-            EvidenceSourceClassification.LOCAL_NEWS: 0.80,
-            EvidenceSourceClassification.SOCIAL_MEDIA_VERIFIED: 0.70,
-            EvidenceSourceClassification.WITNESS_STATEMENT: 0.65,
-            EvidenceSourceClassification.TELEGRAM_CHANNEL: 0.55,
-            EvidenceSourceClassification.FORUM_POST: 0.50,
-            EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED: 0.40,
-            EvidenceSourceClassification.YOUTUBE_VIDEO: 0.45,
-            EvidenceSourceClassification.UNKNOWN: 0.30,
-        }
-
-        return credibility_map.get(classification, 0.5)
+        return _CREDIBILITY_TABLE[classification.code]
 
-    def _calculate_locality(self, source_name: str, geoloc_cues: List[str]) -> float:
+    def _calculate_locality(self, is_local: bool, geoloc_cues: List[str]) -> float:
         """Calculate locality/relevance score.
 
         Args:
-            source_name: Name of the source
+            is_local: Whether the source name marks a local outlet
             geoloc_cues: Extracted geographic cues
 
         Returns:
             Locality score (0-1)
         """
-        score = 0.5  # Base score
-
-        # Boost if source is local
-        if source_name:
-            local_indicators = ["local", "lokaal", "regional", "gemeente"]
-            if any(indicator in source_name.lower() for indicator in local_indicators):
-                score += 0.3
-
-        # Boost if geographic cues are present
-        if geoloc_cues:
-            score += 0.2
+        # Base 0.5, boosted if the source is local and if geographic cues are present
+        return _LOCALITY_SCORES[is_local, bool(geoloc_cues)]
 
-        return min(1.0, score)
-
-    def _calculate_adversary_intent(self, text: str, source_name: str) -> float:
+    def _calculate_adversary_intent(self, text_lower: str, suspicious_hits: int) -> float:
         """Calculate adversarial information operations likelihood.
 
         Args:
-            text: Raw text content
-            source_name: Name of the source
+            text_lower: Lowercased raw text content
+            suspicious_hits: Suspicious patterns found in the source name
 
         Returns:
             Adversary intent score (0-1, higher = more likely adversarial)
         """
-        score = 0.0
-
-        # Red flags for info ops
-        disinfo_indicators = [
-            "hoax", "fake", "false flag", "conspiracy",
-            "coverup", "cover-up", "government lies",
-            "mainstream media", "msm", "propaganda"
-        ]
-
-        text_lower = text.lower()
-        for indicator in disinfo_indicators:
+        # Red flags for info ops (+0.15 each) and suspicious source names (+0.10 each)
+        # Stop scanning once the score is clamped at 1.0 (a saturated count
+        # scores the same as the full one)
+        disinfo_hits = 0
+        saturation = _DISINFO_SATURATION[suspicious_hits]
+        for indicator in _DISINFO_INDICATORS:
             if indicator in text_lower:
-                score += 0.15
-
-        # Check source name for suspicious patterns
-        if source_name:
-            suspicious_patterns = ["anon", "truth", "patriot", "awakened", "woke"]
-            for pattern in suspicious_patterns:
-                if pattern in source_name.lower():
-                    score += 0.10
-
-        return min(1.0, score)
+                disinfo_hits += 1
+                if disinfo_hits == saturation:
+                    break
+        return _ADVERSARY_SCORES[disinfo_hits][suspicious_hits]
 
     def _categorize_item(self, stack: EvidenceStack, item: EvidenceItem) -> None:
         """Categorize evidence item into appropriate stack category.
@@ -367,39 +618,33 @@ class EvidenceStackBuilder:
             stack: EvidenceStack to add item to
             item: EvidenceItem to categorize
         """
-        category_map = {
-            EvidenceSourceClassification.OFFICIAL_REPORT: stack.official_reports,
-            EvidenceSourceClassification.VERIFIED_NEWS: stack.news_articles,
-            EvidenceSourceClassification.LOCAL_NEWS: stack.news_articles,
-            EvidenceSourceClassification.SOCIAL_MEDIA_VERIFIED: stack.social_media_posts,
-            EvidenceSourceClassification.SOCIAL_MEDIA_UNVERIFIED: stack.social_media_posts,
-            EvidenceSourceClassification.TELEGRAM_CHANNEL: stack.telegram_messages,
-            EvidenceSourceClassification.YOUTUBE_VIDEO: stack.youtube_videos,
-            EvidenceSourceClassification.FORUM_POST: stack.forum_posts,
-            EvidenceSourceClassification.WITNESS_STATEMENT: stack.witness_statements,
-        }
-
-        category = category_map.get(item.source_type, stack.news_articles)
+        category = getattr(stack, _CATEGORY_ATTR_TABLE[item.source_type.code])
         category.append(item)
 
-    def _calculate_statistics(self, stack: EvidenceStack) -> None:
+        # Temporal bounds, maintained online (one comparison each per item)
+        published_at = item.published_at
+        if published_at:
+            if stack.earliest_evidence is None or published_at < stack.earliest_evidence:
+                stack.earliest_evidence = published_at
+            if stack.latest_evidence is None or published_at > stack.latest_evidence:
+                stack.latest_evidence = published_at
+
+    def _calculate_statistics(
+        self,
+        stack: EvidenceStack,
+        credibility_scores: List[float],
+    ) -> None:
         """Calculate aggregate statistics for evidence stack.
 
         Args:
             stack: EvidenceStack to calculate statistics for
+            credibility_scores: Credibility of every item in the stack
         """
-        all_items = stack.all_items
-        stack.total_items = len(all_items)
-
-        if all_items:
-            # Average credibility
-            stack.avg_credibility = sum(item.credibility_score for item in all_items) / len(all_items)
-
-            # Temporal bounds
-            published_dates = [item.published_at for item in all_items if item.published_at]
-            if published_dates:
-                stack.earliest_evidence = min(published_dates)
-                stack.latest_evidence = max(published_dates)
+        stack.total_items = len(credibility_scores)
+
+        if credibility_scores:
+            # Average credibility (fsum-based, so correctly rounded)
+            stack.avg_credibility = statistics.fmean(credibility_scores)
 
 
 # Factory function for easy instantiation
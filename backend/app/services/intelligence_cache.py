@@ -0,0 +1,131 @@
+"""Intelligence Cache - Reuses computed intelligence while an incident's inputs are unchanged.
+
+LLM enrichment and operator analysis dominate the cost of the intelligence
+endpoint, yet their inputs (evidence set, target location, site type, and
+the incident and site fields shown in the response) rarely change once an incident has been collected. Results are kept in a bounded,
+time-limited in-process cache keyed by a fingerprint of those inputs; the
+same fingerprint (hashed) guards the materialized copy in the database.
+
+Architecture Layer: services/
+Dependencies: config
+"""
+
+from typing import Any, Hashable, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import time
+from backend.app.config import settings
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Not thread-safe; intended for use from the event loop only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl_seconds: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_cache_key(
+    incident_id: int,
+    evidence_count: int,
+    evidence_max_id: Optional[int],
+    site_type: Optional[str],
+    target_lat: float,
+    target_lon: float,
+    llm_model: str,
+    llm_live: bool,
+    incident_fields: Tuple[Any, ...],
+) -> Tuple:
+    """Build the intelligence cache key for an incident.
+
+    Evidence rows are append-only, so (count, max id) changes whenever
+    evidence is added or removed. The LLM model and mode are part of the
+    key, so mock results are not served once an API key is configured
+    (or after a model change). The incident and site values rendered into
+    the response are part of the key too, so an edited incident (e.g. on
+    re-ingestion) does not keep serving its old title or site name.
+
+    Args:
+        incident_id: ID of the incident
+        evidence_count: Number of evidence rows for the incident
+        evidence_max_id: Highest evidence row ID (None if no evidence)
+        site_type: Site type used for operator analysis
+        target_lat: Target latitude
+        target_lon: Target longitude
+        llm_model: Model used for enrichment ("mock" without an API key)
+        llm_live: Whether enrichment calls the LLM or returns the mock
+        incident_fields: Incident title, country code, occurred_at and
+            location name, as rendered in the response
+
+    Returns:
+        Hashable cache key
+    """
+    return (
+        incident_id,
+        evidence_count,
+        evidence_max_id,
+        site_type,
+        round(target_lat, 5),
+        round(target_lon, 5),
+        llm_model,
+        llm_live,
+        incident_fields,
+    )
+
+
+def fingerprint(cache_key: Tuple) -> str:
+    """Stable SHA-256 hex digest of a cache key, for persisting alongside a payload.
+
+    Args:
+        cache_key: Key returned by make_cache_key
+
+    Returns:
+        64-character hex digest
+    """
+    return hashlib.sha256(repr(cache_key).encode()).hexdigest()
+
+
+# Global cache instance
+intelligence_cache = TTLCache(
+    maxsize=settings.INTELLIGENCE_CACHE_SIZE,
+    ttl_seconds=settings.INTELLIGENCE_CACHE_TTL,
+)
@@ -13,11 +13,60 @@ Architecture Layer: services/
 Dependencies: domain.incident, domain.site
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+import heapq
 import math
+from backend.app.services.process_pool import get_process_pool
+
+
+# Earth radius in meters
+_EARTH_RADIUS_M = 6371000.0
+
+# Candidate grid: sample distances (meters) x bearings (degrees, 0 = north)
+_CANDIDATE_DISTANCES_M = (200, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000)
+_CANDIDATE_BEARINGS_DEG = (0, 45, 90, 135, 180, 225, 270, 315)
+
+# The grid's trig terms do not depend on the target, so they are computed
+# once here: (sin, cos) of each angular distance and of each bearing
+_DISTANCE_TRIG = tuple(
+    (math.sin(d / _EARTH_RADIUS_M), math.cos(d / _EARTH_RADIUS_M)) for d in _CANDIDATE_DISTANCES_M
+)
+_BEARING_TRIG = tuple(
+    (math.sin(math.radians(b)), math.cos(math.radians(b))) for b in _CANDIDATE_BEARINGS_DEG
+)
+
+
+@lru_cache(maxsize=1024)
+def _candidate_grid(target_lat: float, target_lon: float) -> Tuple[Tuple[float, float], ...]:
+    """Candidate grid around a target, memoized per exact target position.
+
+    Incidents recur at the same sites, and the grid is fully determined by
+    the target. Same destination-point formula as _offset_location, with
+    the target's trig terms computed once and the grid's taken from the
+    module tables. Keyed on exact coordinates (not rounded), so cached
+    grids are identical to freshly computed ones.
+    """
+    lat_rad = math.radians(target_lat)
+    lon_rad = math.radians(target_lon)
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+
+    candidates = []
+    for sin_d, cos_d in _DISTANCE_TRIG:
+        for sin_b, cos_b in _BEARING_TRIG:
+            new_lat_rad = math.asin(sin_lat * cos_d + cos_lat * sin_d * cos_b)
+            new_lon_rad = lon_rad + math.atan2(
+                sin_b * sin_d * cos_lat,
+                cos_d - sin_lat * math.sin(new_lat_rad)
+            )
+            candidates.append((math.degrees(new_lat_rad), math.degrees(new_lon_rad)))
+
+    return tuple(candidates)
 
 
 class CoverType(str, Enum):
@@ -40,11 +89,23 @@ class TerrainSuitability(str, Enum):
     UNSUITABLE = "unsuitable"  # No cover, no access, or inside perimeter
 
 
+# Cover types the mock inference picks from, indexed by location hash % 5
+_MOCK_COVER_TYPES = (
+    CoverType.FOREST,
+    CoverType.URBAN_BUILDING,
+    CoverType.PARKING_LOT,
+    CoverType.RURAL_STRUCTURE,
+    CoverType.VEHICLE,
+)
+
+
 class OperatorHotspot(BaseModel):
     """Predicted operator launch site with scoring breakdown.
 
     This represents a single predicted location where a drone operator might have been positioned.
     """
+    model_config = ConfigDict(frozen=True)
+
     latitude: float = Field(..., description="Latitude of predicted location")
     longitude: float = Field(..., description="Longitude of predicted location")
 
@@ -69,11 +130,27 @@ class OperatorHotspot(BaseModel):
     reasoning: str = Field(..., description="Human-readable explanation of why this location was selected")
 
 
+class _CandidateScores(NamedTuple):
+    """Scores of one candidate location. Every candidate is scored, but only
+    the returned few are turned into OperatorHotspot models."""
+    latitude: float
+    longitude: float
+    distance_to_target_m: float
+    cover_score: float
+    distance_score: float
+    exfil_score: float
+    opsec_score: float
+    terrain_score: float
+    total_score: float
+
+
 class OperatorAnalysis(BaseModel):
     """Complete operator analysis for an incident.
 
     Contains 1-3 predicted operator locations ranked by likelihood.
     """
+    model_config = ConfigDict(frozen=True)
+
     incident_id: int
     target_latitude: float = Field(..., description="Target incident location latitude")
     target_longitude: float = Field(..., description="Target incident location longitude")
@@ -82,11 +159,31 @@ class OperatorAnalysis(BaseModel):
     predicted_hotspots: List[OperatorHotspot] = Field(default_factory=list, description="1-3 predicted locations")
 
     # Analysis metadata
-    analyzed_at: datetime = Field(default_factory=datetime.utcnow)
+    analyzed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     search_radius_m: float = Field(default=4000.0, description="Search radius used (meters)")
     perimeter_radius_m: float = Field(default=500.0, description="Security perimeter radius (meters)")
 
 
+# Site types guarded by a larger (1000m) security perimeter
+_HIGH_SECURITY_SITE_TYPES = frozenset({"military", "airport"})
+
+# Order of the score components in the weight tuple used while scoring
+_WEIGHT_ORDER = ("cover", "distance", "exfil", "opsec", "terrain")
+
+# Incidents are independent; analysis takes about half a millisecond per
+# incident, so only large batches go to worker processes
+_PARALLEL_MIN_INCIDENTS = 64
+_PARALLEL_CHUNK_SIZE = 32
+
+
+def _analyze_chunk(
+    engine: "OperatorHideoutEngine",
+    incidents: List[Tuple[int, float, float, Optional[str]]],
+) -> List[OperatorAnalysis]:
+    """Worker entry point: analysis of each incident of one chunk."""
+    return [engine.analyze_incident(*incident) for incident in incidents]
+
+
 class OperatorHideoutEngine:
     """Engine for predicting drone operator launch sites using OPSEC-TTP analysis.
 
@@ -144,17 +241,27 @@ class OperatorHideoutEngine:
         # Generate candidate locations (grid-based search around target)
         candidates = self._generate_candidates(target_lat, target_lon)
 
-        # Score each candidate
-        scored_hotspots = []
-        for lat, lon in candidates:
-            hotspot = self._score_location(lat, lon, target_lat, target_lon, site_type)
-            scored_hotspots.append(hotspot)
+        # Distance of every candidate to the target, in one batch
+        distances = self._haversine_distances(candidates, target_lat, target_lon)
 
-        # Sort by total score (descending)
-        scored_hotspots.sort(key=lambda h: h.total_score, reverse=True)
+        # Distance-only scores, also in one batch each
+        distance_scores = self._score_distances(distances)
+        opsec_scores = self._score_opsec_batch(distances, self._adjusted_perimeter(site_type))
 
-        # Take top 3
-        top_hotspots = scored_hotspots[:3]
+        # Weights read once per incident, not per candidate
+        weights = tuple(self.weights[name] for name in _WEIGHT_ORDER)
+
+        # Score each candidate
+        scored_candidates = []
+        for (lat, lon), distance_m, distance_score, opsec_score in zip(
+            candidates, distances, distance_scores, opsec_scores
+        ):
+            scores = self._score_location(lat, lon, distance_m, distance_score, opsec_score, weights)
+            scored_candidates.append(scores)
+
+        # Take top 3 by total score (same order and ties as a stable descending sort)
+        top_candidates = heapq.nlargest(3, scored_candidates, key=lambda s: s.total_score)
+        top_hotspots = [self._materialize_hotspot(scores) for scores in top_candidates]
 
         return OperatorAnalysis(
             incident_id=incident_id,
@@ -165,7 +272,29 @@ class OperatorHideoutEngine:
             perimeter_radius_m=self.perimeter_radius_m,
         )
 
-    def _generate_candidates(self, target_lat: float, target_lon: float) -> List[Tuple[float, float]]:
+    def analyze_incidents_batch(
+        self,
+        incidents: List[Tuple[int, float, float, Optional[str]]],
+    ) -> List[OperatorAnalysis]:
+        """Analyze many incidents, in worker processes for large batches.
+
+        Args:
+            incidents: (incident_id, target_lat, target_lon, site_type) tuples
+
+        Returns:
+            OperatorAnalysis per incident, in input order
+        """
+        if len(incidents) < _PARALLEL_MIN_INCIDENTS:
+            return _analyze_chunk(self, incidents)
+
+        chunks = [
+            incidents[start:start + _PARALLEL_CHUNK_SIZE]
+            for start in range(0, len(incidents), _PARALLEL_CHUNK_SIZE)
+        ]
+        results = get_process_pool().map(_analyze_chunk, repeat(self), chunks)
+        return [analysis for chunk in results for analysis in chunk]
+
+    def _generate_candidates(self, target_lat: float, target_lon: float) -> Tuple[Tuple[float, float], ...]:
         """Generate candidate operator locations around target.
 
         Uses a grid-based approach to sample locations at various distances and directions.
@@ -175,23 +304,9 @@ class OperatorHideoutEngine:
             target_lon: Target longitude
 
         Returns:
-            List of (lat, lon) tuples
+            Tuple of (lat, lon) tuples (shared cache entry)
         """
-        candidates = []
-
-        # Sample at different distances (in meters)
-        distances = [200, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000]
-
-        # Sample at different angles (in degrees, 0 = north)
-        angles = [0, 45, 90, 135, 180, 225, 270, 315]
-
-        for distance_m in distances:
-            for angle_deg in angles:
-                # Convert distance/bearing to lat/lon offset
-                lat, lon = self._offset_location(target_lat, target_lon, distance_m, angle_deg)
-                candidates.append((lat, lon))
-
-        return candidates
+        return _candidate_grid(target_lat, target_lon)
 
     def _offset_location(
         self,
@@ -211,8 +326,7 @@ class OperatorHideoutEngine:
         Returns:
             (new_lat, new_lon)
         """
-        # Earth radius in meters
-        R = 6371000.0
+        R = _EARTH_RADIUS_M
 
         # Convert to radians
         lat_rad = math.radians(lat)
@@ -237,44 +351,57 @@ class OperatorHideoutEngine:
         self,
         lat: float,
         lon: float,
-        target_lat: float,
-        target_lon: float,
-        site_type: Optional[str]
-    ) -> OperatorHotspot:
+        distance_m: float,
+        distance_score: float,
+        opsec_score: float,
+        weights: Tuple[float, ...]
+    ) -> _CandidateScores:
         """Score a candidate location based on OPSEC-TTP rules.
 
         Args:
             lat: Candidate latitude
             lon: Candidate longitude
-            target_lat: Target latitude
-            target_lon: Target longitude
-            site_type: Site type for perimeter estimation
+            distance_m: Distance from candidate to target in meters
+            distance_score: _score_distance of the candidate
+            opsec_score: _score_opsec of the candidate
+            weights: Component weights in _WEIGHT_ORDER
 
         Returns:
-            Scored OperatorHotspot
+            _CandidateScores of the candidate
         """
-        # Calculate distance to target
-        distance_m = self._haversine_distance(lat, lon, target_lat, target_lon)
-
-        # Score components
+        # Remaining score components
         cover_score = self._score_cover(lat, lon)
-        distance_score = self._score_distance(distance_m)
         exfil_score = self._score_exfil(lat, lon)
-        opsec_score = self._score_opsec(distance_m, site_type)
         terrain_score = self._score_terrain(lat, lon)
 
         # Calculate weighted composite score
+        cover_weight, distance_weight, exfil_weight, opsec_weight, terrain_weight = weights
         total_score = (
-            self.weights["cover"] * cover_score +
-            self.weights["distance"] * distance_score +
-            self.weights["exfil"] * exfil_score +
-            self.weights["opsec"] * opsec_score +
-            self.weights["terrain"] * terrain_score
+            cover_weight * cover_score +
+            distance_weight * distance_score +
+            exfil_weight * exfil_score +
+            opsec_weight * opsec_score +
+            terrain_weight * terrain_score
+        )
+
+        return _CandidateScores(
+            lat, lon, distance_m,
+            cover_score, distance_score, exfil_score, opsec_score, terrain_score,
+            total_score,
         )
 
+    def _materialize_hotspot(self, scores: _CandidateScores) -> OperatorHotspot:
+        """Build the OperatorHotspot for a selected candidate.
+
+        Args:
+            scores: _CandidateScores from _score_location
+
+        Returns:
+            OperatorHotspot with cover type, suitability and reasoning
+        """
         # Determine cover type and terrain suitability (mock for now)
-        cover_type = self._infer_cover_type(lat, lon)
-        terrain_suitability = self._infer_terrain_suitability(total_score)
+        cover_type = self._infer_cover_type(scores.latitude, scores.longitude)
+        terrain_suitability = self._infer_terrain_suitability(scores.total_score)
 
         # Mock road data
         road_type = "secondary_road"
@@ -282,21 +409,23 @@ class OperatorHideoutEngine:
 
         # Generate reasoning
         reasoning = self._generate_reasoning(
-            distance_m, cover_score, exfil_score, opsec_score, cover_type
+            scores.distance_to_target_m, scores.cover_score, scores.exfil_score, scores.opsec_score, cover_type
         )
 
-        return OperatorHotspot(
-            latitude=lat,
-            longitude=lon,
-            cover_score=cover_score,
-            distance_score=distance_score,
-            exfil_score=exfil_score,
-            opsec_score=opsec_score,
-            terrain_score=terrain_score,
-            total_score=total_score,
+        # Every field is a _CandidateScores value computed above, so
+        # validation would only re-check this engine's own arithmetic
+        return OperatorHotspot.model_construct(
+            latitude=scores.latitude,
+            longitude=scores.longitude,
+            cover_score=scores.cover_score,
+            distance_score=scores.distance_score,
+            exfil_score=scores.exfil_score,
+            opsec_score=scores.opsec_score,
+            terrain_score=scores.terrain_score,
+            total_score=scores.total_score,
             cover_type=cover_type,
             terrain_suitability=terrain_suitability,
-            distance_to_target_m=distance_m,
+            distance_to_target_m=scores.distance_to_target_m,
             nearest_road_type=road_type,
             nearest_road_distance_m=road_distance,
             reasoning=reasoning,
@@ -333,24 +462,40 @@ class OperatorHideoutEngine:
         Returns:
             Distance score (0-1)
         """
-        # Penalty for too close (inside perimeter or easily detected)
-        if distance_m < self.perimeter_radius_m:
-            return 0.0  # Inside security perimeter = disqualified
+        return self._score_distances([distance_m])[0]
 
-        if distance_m < self.min_distance_m:
-            return 0.2  # Too close, high detection risk
+    def _score_distances(self, distances: List[float]) -> List[float]:
+        """Score many distances from target at once (see _score_distance).
 
-        # Sweet spot: 500m - 2000m (good balance of range and concealment)
-        if 500 <= distance_m <= 2000:
-            return 1.0
+        Args:
+            distances: Distances to target in meters
 
-        # Gradual penalty for longer distances (signal degradation, harder control)
-        if distance_m <= self.max_distance_m:
-            # Linear decay from 2000m to 4000m: 1.0 -> 0.5
-            return 1.0 - ((distance_m - 2000) / (self.max_distance_m - 2000)) * 0.5
+        Returns:
+            Distance scores (0-1), in input order
+        """
+        perimeter = self.perimeter_radius_m
+        min_distance = self.min_distance_m
+        max_distance = self.max_distance_m
 
-        # Beyond max range: very low score
-        return 0.1
+        scores = []
+        for distance_m in distances:
+            # Penalty for too close (inside perimeter or easily detected)
+            if distance_m < perimeter:
+                score = 0.0  # Inside security perimeter = disqualified
+            elif distance_m < min_distance:
+                score = 0.2  # Too close, high detection risk
+            # Sweet spot: 500m - 2000m (good balance of range and concealment)
+            elif 500 <= distance_m <= 2000:
+                score = 1.0
+            # Gradual penalty for longer distances (signal degradation, harder control)
+            elif distance_m <= max_distance:
+                # Linear decay from 2000m to 4000m: 1.0 -> 0.5
+                score = 1.0 - ((distance_m - 2000) / (max_distance - 2000)) * 0.5
+            else:
+                score = 0.1  # Beyond max range: very low score
+            scores.append(score)
+
+        return scores
 
     def _score_exfil(self, lat: float, lon: float) -> float:
         """Score exfiltration route quality.
@@ -383,20 +528,45 @@ class OperatorHideoutEngine:
         Returns:
             OPSEC score (0-1)
         """
-        # Critical rule: must be outside security perimeter
-        if distance_m < self.perimeter_radius_m:
-            return 0.0  # Absolute disqualifier
+        return self._score_opsec_batch([distance_m], self._adjusted_perimeter(site_type))[0]
 
-        # Adjust perimeter based on site type
-        adjusted_perimeter = self.perimeter_radius_m
-        if site_type in ["military", "airport"]:
-            adjusted_perimeter = 1000.0  # Larger perimeter for high-security sites
+    def _adjusted_perimeter(self, site_type: Optional[str]) -> float:
+        """Security perimeter adjusted for site type (resolved once per incident).
 
-        if distance_m < adjusted_perimeter:
-            return 0.3  # Still too close to secure area
+        Args:
+            site_type: Site type (airport, military, etc.)
 
-        # Good OPSEC compliance
-        return 1.0
+        Returns:
+            Perimeter radius in meters
+        """
+        if site_type in _HIGH_SECURITY_SITE_TYPES:
+            return 1000.0  # Larger perimeter for high-security sites
+        return self.perimeter_radius_m
+
+    def _score_opsec_batch(self, distances: List[float], adjusted_perimeter: float) -> List[float]:
+        """Score OPSEC compliance of many distances at once (see _score_opsec).
+
+        Args:
+            distances: Distances to target in meters
+            adjusted_perimeter: _adjusted_perimeter for the site type
+
+        Returns:
+            OPSEC scores (0-1), in input order
+        """
+        perimeter = self.perimeter_radius_m
+
+        scores = []
+        for distance_m in distances:
+            # Critical rule: must be outside security perimeter
+            if distance_m < perimeter:
+                score = 0.0  # Absolute disqualifier
+            elif distance_m < adjusted_perimeter:
+                score = 0.3  # Still too close to secure area
+            else:
+                score = 1.0  # Good OPSEC compliance
+            scores.append(score)
+
+        return scores
 
     def _score_terrain(self, lat: float, lon: float) -> float:
         """Score terrain suitability.
@@ -430,17 +600,7 @@ class OperatorHideoutEngine:
         """
         # Mock inference
         location_hash = hash((round(lat, 4), round(lon, 4)))
-        cover_index = location_hash % 5
-
-        cover_types = [
-            CoverType.FOREST,
-            CoverType.URBAN_BUILDING,
-            CoverType.PARKING_LOT,
-            CoverType.RURAL_STRUCTURE,
-            CoverType.VEHICLE,
-        ]
-
-        return cover_types[cover_index]
+        return _MOCK_COVER_TYPES[location_hash % len(_MOCK_COVER_TYPES)]
 
     def _infer_terrain_suitability(self, total_score: float) -> TerrainSuitability:
         """Infer terrain suitability from composite score.
@@ -482,41 +642,39 @@ class OperatorHideoutEngine:
         Returns:
             Reasoning string
         """
-        reasoning_parts = []
-
         # Distance reasoning
         if 500 <= distance_m <= 2000:
-            reasoning_parts.append(f"Optimal distance ({distance_m:.0f}m) for drone control")
+            distance_part = f"Optimal distance ({distance_m:.0f}m) for drone control"
         elif distance_m > 2000:
-            reasoning_parts.append(f"Moderate distance ({distance_m:.0f}m) - within drone range")
+            distance_part = f"Moderate distance ({distance_m:.0f}m) - within drone range"
         else:
-            reasoning_parts.append(f"Close distance ({distance_m:.0f}m) - high risk but doable")
+            distance_part = f"Close distance ({distance_m:.0f}m) - high risk but doable"
 
         # Cover reasoning
         if cover_score >= 0.7:
-            reasoning_parts.append(f"Excellent {cover_type.value} cover for concealment")
+            cover_part = f"Excellent {cover_type.value} cover for concealment"
         elif cover_score >= 0.5:
-            reasoning_parts.append(f"Good {cover_type.value} cover available")
+            cover_part = f"Good {cover_type.value} cover available"
         else:
-            reasoning_parts.append(f"Limited {cover_type.value} cover - more exposed")
+            cover_part = f"Limited {cover_type.value} cover - more exposed"
 
         # Exfil reasoning
         if exfil_score >= 0.7:
-            reasoning_parts.append("Good road access for quick exfiltration")
+            exfil_part = "Good road access for quick exfiltration"
         elif exfil_score >= 0.5:
-            reasoning_parts.append("Moderate exfil routes available")
+            exfil_part = "Moderate exfil routes available"
         else:
-            reasoning_parts.append("Limited escape routes")
+            exfil_part = "Limited escape routes"
 
         # OPSEC reasoning
         if opsec_score == 1.0:
-            reasoning_parts.append("Outside security perimeter - good OPSEC")
+            opsec_part = "Outside security perimeter - good OPSEC"
         elif opsec_score > 0:
-            reasoning_parts.append("Marginal OPSEC compliance")
+            opsec_part = "Marginal OPSEC compliance"
         else:
-            reasoning_parts.append("OPSEC violation - inside restricted area")
+            opsec_part = "OPSEC violation - inside restricted area"
 
-        return ". ".join(reasoning_parts) + "."
+        return f"{distance_part}. {cover_part}. {exfil_part}. {opsec_part}."
 
     def _haversine_distance(
         self,
@@ -555,6 +713,39 @@ class OperatorHideoutEngine:
 
         return R * c
 
+    def _haversine_distances(
+        self,
+        points: List[Tuple[float, float]],
+        target_lat: float,
+        target_lon: float
+    ) -> List[float]:
+        """Calculate haversine distance from each point to the target.
+
+        Same formula as _haversine_distance, with the target's terms computed
+        once for the whole batch instead of once per point.
+
+        Args:
+            points: (lat, lon) tuples
+            target_lat: Target latitude
+            target_lon: Target longitude
+
+        Returns:
+            Distances in meters, in point order
+        """
+        R = _EARTH_RADIUS_M
+        cos_target = math.cos(math.radians(target_lat))
+
+        distances = []
+        for lat, lon in points:
+            a = (
+                math.sin(math.radians(target_lat - lat) / 2) ** 2 +
+                math.cos(math.radians(lat)) * cos_target *
+                math.sin(math.radians(target_lon - lon) / 2) ** 2
+            )
+            distances.append(R * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))))
+
+        return distances
+
 
 # Factory function for easy instantiation
 def analyze_operator_location(
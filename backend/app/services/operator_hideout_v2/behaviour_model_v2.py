@@ -4,8 +4,10 @@ Operator Behaviour Model v2.0
 Enhanced scoring model with terrain awareness, vector alignment, and confidence.
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import math
 import logging
 
@@ -77,8 +79,10 @@ DRONE_RANGE_PROFILES = {
 }
 
 
-def get_drone_range_profile(drone_type: Optional[str]) -> Dict:
-    """Get range profile for drone type"""
+@lru_cache(maxsize=None)
+def get_drone_range_profile(drone_type: Optional[str]) -> Mapping[str, Any]:
+    """Get range profile for drone type (memoized: called once per candidate;
+    a read-only view of the shared DRONE_RANGE_PROFILES entry)"""
     if not drone_type:
         drone_type = DroneType.UNKNOWN
 
@@ -87,7 +91,7 @@ def get_drone_range_profile(drone_type: Optional[str]) -> Dict:
     except ValueError:
         dtype = DroneType.UNKNOWN
 
-    return DRONE_RANGE_PROFILES[dtype]
+    return MappingProxyType(DRONE_RANGE_PROFILES[dtype])
 
 
 def compute_range_score(distance_m: float, drone_type: Optional[str] = None) -> float:
@@ -182,6 +186,18 @@ def compute_opsec_penalty(distance_m: float, perimeter_radius_m: float) -> float
     return 1.0
 
 
+# Default composite weights (sum to 1.0)
+DEFAULT_COMPOSITE_WEIGHTS = {
+    "cover": 0.20,
+    "concealment": 0.15,
+    "exfil": 0.15,
+    "range": 0.15,
+    "los": 0.10,
+    "vector_alignment": 0.15,
+    "locality_consistency": 0.10,
+}
+
+
 def compute_composite_score_v2(
     cover_score: float,
     concealment_score: float,
@@ -205,22 +221,13 @@ def compute_composite_score_v2(
         vector_alignment_score: Vector alignment with evidence (0-1)
         locality_consistency_score: Consistency with local evidence (0-1)
         opsec_penalty: OPSEC compliance (0 or 1)
-        weights: Optional custom weights
+        weights: Optional custom weights (default: DEFAULT_COMPOSITE_WEIGHTS)
 
     Returns:
         Dict with 'total_score', 'components', 'weighted_components'
     """
-    # Default weights (sum to 1.0)
     if weights is None:
-        weights = {
-            "cover": 0.20,
-            "concealment": 0.15,
-            "exfil": 0.15,
-            "range": 0.15,
-            "los": 0.10,
-            "vector_alignment": 0.15,
-            "locality_consistency": 0.10,
-        }
+        weights = DEFAULT_COMPOSITE_WEIGHTS
 
     # Compute weighted components
     weighted_components = {
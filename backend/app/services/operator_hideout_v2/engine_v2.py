@@ -9,10 +9,12 @@ Enhanced version with:
 - Drone-type-aware range modeling
 """
 
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
+import heapq
 import logging
+import math
 
 # Import shared models
 from .models import CoverType, TerrainSuitability
@@ -28,7 +30,7 @@ from ..terrain import (
     compute_exfil_routes,
     score_exfil_attractiveness,
     compute_line_of_sight,
-    compute_los_quality_score,
+    compute_los_quality_scores,
 )
 
 from ..osint_fusion import (
@@ -51,6 +53,17 @@ from .site_boundary import get_site_boundary_by_location, SiteBoundary
 
 logger = logging.getLogger(__name__)
 
+# Candidate grid (same as V1): ring distances x 8 directions
+_GRID_DISTANCES_KM = (0.2, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0)
+_GRID_ANGLES_DEG = (0, 45, 90, 135, 180, 225, 270, 315)
+
+# Target-independent grid terms, computed once: per distance, the distance
+# and its latitude offset in degrees; per angle, the angle, cos and sin
+_GRID_DISTANCE_TERMS = tuple((d, d / 111.0) for d in _GRID_DISTANCES_KM)
+_GRID_ANGLE_TERMS = tuple(
+    (a, math.cos(math.radians(a)), math.sin(math.radians(a))) for a in _GRID_ANGLES_DEG
+)
+
 
 class OperatorHotspotV2(BaseModel):
     """
@@ -91,6 +104,25 @@ class OperatorHotspotV2(BaseModel):
     confidence_reasoning: str = Field("")
 
 
+class _CandidateScoresV2(NamedTuple):
+    """Scores of one candidate location. Every candidate is scored, but only
+    the returned few are turned into OperatorHotspotV2 models."""
+    latitude: float
+    longitude: float
+    distance_to_target_m: float
+    cover_score: float
+    concealment_score: float
+    exfil_score: float
+    range_score: float
+    los_score: float
+    vector_alignment_score: float
+    locality_consistency_score: float
+    opsec_penalty: float
+    total_score: float
+    landuse: Optional[str]
+    components: Dict[str, float]
+
+
 class OperatorAnalysisV2(BaseModel):
     """Enhanced operator analysis with v2 fields"""
     incident_id: int
@@ -100,7 +132,7 @@ class OperatorAnalysisV2(BaseModel):
     predicted_hotspots: List[OperatorHotspotV2] = Field(default_factory=list)
 
     # Analysis metadata
-    analyzed_at: datetime = Field(default_factory=datetime.utcnow)
+    analyzed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     search_radius_m: float = Field(default=4000.0)
     perimeter_radius_m: float = Field(default=500.0)
 
@@ -189,22 +221,47 @@ class OperatorHideoutEngineV2:
         # Generate candidate locations (same grid as V1)
         candidates = self._generate_candidate_grid(target_lat, target_lon)
 
-        # Score each candidate with V2 model
-        scored_hotspots = []
+        # Distance of every candidate to the target, in one batch
+        distances_m = self._haversine_distances_m(candidates, target_lat, target_lon)
+
+        # HARD CONSTRAINT: candidates inside the site boundary, in one batch
+        if site_boundary:
+            inside_flags = site_boundary.is_inside_boundary_batch(
+                [(candidate["lat"], candidate["lon"]) for candidate in candidates]
+            )
+        else:
+            inside_flags = [False] * len(candidates)
+
+        # HARD CONSTRAINT: Filter out candidates inside site boundary
+        kept_candidates = []
         filtered_count = 0
-        for candidate in candidates:
-            # HARD CONSTRAINT: Filter out candidates inside site boundary
-            if site_boundary and site_boundary.is_inside_boundary(candidate["lat"], candidate["lon"]):
+        for candidate, distance_m, inside in zip(candidates, distances_m, inside_flags):
+            if inside:
                 filtered_count += 1
                 logger.debug(f"Filtered candidate at ({candidate['lat']:.4f}, {candidate['lon']:.4f}) "
                             f"- inside {site_boundary.site_name} boundary")
                 continue
+            kept_candidates.append((candidate, distance_m))
 
-            hotspot = self._score_candidate_v2(
+        if filtered_count > 0:
+            logger.info(f"Filtered {filtered_count}/{len(candidates)} candidates inside site boundary")
+
+        # LOS quality of every remaining candidate to the target, in one batch
+        los_scores = compute_los_quality_scores(
+            [(candidate["lat"], candidate["lon"]) for candidate, _ in kept_candidates],
+            target_lat, target_lon, elevation_map,
+        )
+
+        # Score each candidate with V2 model
+        scored_candidates = []
+        for (candidate, distance_m), los_score in zip(kept_candidates, los_scores):
+            scores = self._score_candidate_v2(
                 candidate["lat"],
                 candidate["lon"],
                 target_lat,
                 target_lon,
+                distance_m,
+                los_score,
                 osm_data,
                 elevation_map,
                 drone_type,
@@ -213,20 +270,16 @@ class OperatorHideoutEngineV2:
                 time_of_day,
                 evidence_weight,
             )
-            scored_hotspots.append(hotspot)
-
-        if filtered_count > 0:
-            logger.info(f"Filtered {filtered_count}/{len(candidates)} candidates inside site boundary")
-
-        # Rank by total score
-        scored_hotspots.sort(key=lambda h: h.total_score, reverse=True)
+            scored_candidates.append(scores)
 
-        # Take top 3
-        top_hotspots = scored_hotspots[:3]
+        # Rank by total score and take top 3 (ties keep candidate order)
+        top_candidates = heapq.nlargest(3, scored_candidates, key=lambda c: c.total_score)
 
-        # Assign ranks
-        for rank, hotspot in enumerate(top_hotspots, 1):
-            hotspot.reasoning = f"Rank #{rank}: " + hotspot.reasoning
+        # Build hotspots, with ranks, for the selected candidates only
+        top_hotspots = [
+            self._materialize_hotspot_v2(scores, rank, evidence_weight)
+            for rank, scores in enumerate(top_candidates, 1)
+        ]
 
         return OperatorAnalysisV2(
             incident_id=incident_id,
@@ -244,19 +297,16 @@ class OperatorHideoutEngineV2:
 
     def _generate_candidate_grid(self, center_lat: float, center_lon: float) -> List[Dict]:
         """Generate candidate locations in a grid pattern"""
-        import math
-
-        distances_km = [0.2, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]
-        angles = [0, 45, 90, 135, 180, 225, 270, 315]  # 8 directions
+        # Only the longitude scale depends on the target
+        km_per_lon_degree = 111.0 * math.cos(math.radians(center_lat))
 
         candidates = []
-        for dist_km in distances_km:
-            for angle_deg in angles:
-                angle_rad = math.radians(angle_deg)
-
+        for dist_km, lat_degrees in _GRID_DISTANCE_TERMS:
+            lon_degrees = dist_km / km_per_lon_degree
+            for angle_deg, cos_angle, sin_angle in _GRID_ANGLE_TERMS:
                 # Convert to lat/lon offset
-                lat_offset = (dist_km / 111.0) * math.cos(angle_rad)
-                lon_offset = (dist_km / (111.0 * math.cos(math.radians(center_lat)))) * math.sin(angle_rad)
+                lat_offset = lat_degrees * cos_angle
+                lon_offset = lon_degrees * sin_angle
 
                 candidates.append({
                     "lat": center_lat + lat_offset,
@@ -273,6 +323,8 @@ class OperatorHideoutEngineV2:
         candidate_lon: float,
         target_lat: float,
         target_lon: float,
+        distance_m: float,
+        los_score: float,
         osm_data: Any,
         elevation_map: Any,
         drone_type: Optional[str],
@@ -280,11 +332,9 @@ class OperatorHideoutEngineV2:
         exit_vector: Optional[str],
         time_of_day: str,
         evidence_weight: float,
-    ) -> OperatorHotspotV2:
-        """Score a candidate location with V2 model"""
-
-        # Compute distance
-        distance_m = self._haversine_distance(candidate_lat, candidate_lon, target_lat, target_lon) * 1000
+    ) -> _CandidateScoresV2:
+        """Score a candidate location with V2 model (distance_m: to the target, in meters;
+        los_score: from compute_los_quality_scores)"""
 
         # 1. Cover & Concealment (TIL)
         cover_data = compute_combined_cover_concealment(
@@ -300,9 +350,7 @@ class OperatorHideoutEngineV2:
         # 3. Range score (drone-type-aware)
         range_score = compute_range_score(distance_m, drone_type)
 
-        # 4. LOS quality (TIL)
-        los_score = compute_los_quality_score(candidate_lat, candidate_lon,
-                                              target_lat, target_lon, elevation_map)
+        # 4. LOS quality (TIL): los_score, computed for all candidates up front
 
         # 5. Vector alignment (OSINT fusion)
         vector_align_result = score_vector_alignment(
@@ -335,44 +383,70 @@ class OperatorHideoutEngineV2:
             composite["total_score"], time_of_day, cover_score, concealment_score
         )
 
+        return _CandidateScoresV2(
+            latitude=candidate_lat,
+            longitude=candidate_lon,
+            distance_to_target_m=distance_m,
+            cover_score=cover_score,
+            concealment_score=concealment_score,
+            exfil_score=exfil_score,
+            range_score=range_score,
+            los_score=los_score,
+            vector_alignment_score=vector_alignment_score,
+            locality_consistency_score=locality_consistency_score,
+            opsec_penalty=opsec_penalty,
+            total_score=total_score,
+            landuse=landuse,
+            components=composite["components"],
+        )
+
+    def _materialize_hotspot_v2(
+        self,
+        scores: _CandidateScoresV2,
+        rank: int,
+        evidence_weight: float,
+    ) -> OperatorHotspotV2:
+        """Build the OperatorHotspotV2 for a selected candidate, with its rank"""
+
         # Compute confidence
         confidence_data = compute_confidence_level(
-            composite["components"],
+            scores.components,
             evidence_weight,
-            vector_alignment_score
+            scores.vector_alignment_score
         )
 
         # Determine cover type and terrain suitability
-        cover_type = self._landuse_to_cover_type(landuse)
-        terrain_suitability = self._score_to_terrain_suitability(total_score)
+        cover_type = self._landuse_to_cover_type(scores.landuse)
+        terrain_suitability = self._score_to_terrain_suitability(scores.total_score)
 
         # Generate reasoning
         reasoning = self._generate_reasoning_v2(
-            distance_m, cover_score, exfil_score, range_score, los_score,
-            vector_alignment_score, cover_type, terrain_suitability
+            scores.distance_to_target_m, scores.cover_score, scores.exfil_score,
+            scores.range_score, scores.los_score, scores.vector_alignment_score,
+            cover_type, terrain_suitability
         )
 
         return OperatorHotspotV2(
-            latitude=candidate_lat,
-            longitude=candidate_lon,
-            cover_score=cover_score,
-            distance_score=range_score,
-            exfil_score=exfil_score,
-            opsec_score=opsec_penalty,
-            terrain_score=los_score,
-            total_score=total_score,
+            latitude=scores.latitude,
+            longitude=scores.longitude,
+            cover_score=scores.cover_score,
+            distance_score=scores.range_score,
+            exfil_score=scores.exfil_score,
+            opsec_score=scores.opsec_penalty,
+            terrain_score=scores.los_score,
+            total_score=scores.total_score,
             cover_type=cover_type,
             terrain_suitability=terrain_suitability,
-            distance_to_target_m=distance_m,
+            distance_to_target_m=scores.distance_to_target_m,
             nearest_road_type="secondary_road",  # From OSM data
             nearest_road_distance_m=50.0,  # From OSM data
-            reasoning=reasoning,
+            reasoning=f"Rank #{rank}: " + reasoning,
             # V2 fields
-            concealment_score=concealment_score,
-            range_score=range_score,
-            los_score=los_score,
-            vector_alignment_score=vector_alignment_score,
-            locality_consistency_score=locality_consistency_score,
+            concealment_score=scores.concealment_score,
+            range_score=scores.range_score,
+            los_score=scores.los_score,
+            vector_alignment_score=scores.vector_alignment_score,
+            locality_consistency_score=scores.locality_consistency_score,
             confidence_level=confidence_data["level"],
             confidence_score=confidence_data["score"],
             confidence_reasoning=confidence_data["reasoning"],
@@ -457,19 +531,22 @@ class OperatorHideoutEngineV2:
 
         return "; ".join(reasons) + "."
 
-    def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Haversine distance in kilometers"""
-        import math
-        R = 6371.0
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+    def _haversine_distances_m(self, candidates: List[Dict], target_lat: float, target_lon: float) -> List[float]:
+        """Haversine distance from each candidate to the target, in meters.
 
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        Great-circle distance on a 6371 km sphere; the target's cosine is
+        computed once for the batch.
+        """
+        R = 6371.0
+        cos_target = math.cos(math.radians(target_lat))
 
-        return R * c
+        distances = []
+        for candidate in candidates:
+            lat = candidate["lat"]
+            a = (math.sin(math.radians(target_lat - lat) / 2) ** 2 +
+                 math.cos(math.radians(lat)) * cos_target *
+                 math.sin(math.radians(target_lon - candidate["lon"]) / 2) ** 2)
+            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+            distances.append(R * c * 1000)
+
+        return distances
@@ -11,6 +11,81 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in kilometers"""
+    R = 6371.0
+
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         math.sin(delta_lon / 2) ** 2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return R * c
+
+
+def _polygon_edges(vertices: List[Tuple[float, float]]) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Precompute polygon edges for repeated point checks.
+
+    One tuple per edge (v[i], v[i + 1]), closing back to v[0], in the order
+    both the ray cast and the edge-distance scan visit them:
+    (v1_lat, v1_lon, v2_lat, v2_lon, dx, dy, dx * dx + dy * dy,
+    min_lon, max_lon, max_lat)
+    """
+    edges = []
+    n = len(vertices)
+    for i in range(n):
+        v1_lat, v1_lon = vertices[i]
+        v2_lat, v2_lon = vertices[(i + 1) % n]
+        dx = v2_lon - v1_lon
+        dy = v2_lat - v1_lat
+        edges.append((
+            v1_lat, v1_lon, v2_lat, v2_lon, dx, dy, dx * dx + dy * dy,
+            min(v1_lon, v2_lon), max(v1_lon, v2_lon), max(v1_lat, v2_lat),
+        ))
+    return tuple(edges)
+
+
+def _point_in_edges(lat: float, lon: float, edges: Tuple[Tuple[float, ...], ...]) -> bool:
+    """Ray casting point-in-polygon test over precomputed edges"""
+    inside = False
+    for p1_lat, p1_lon, p2_lat, p2_lon, _, _, _, min_lon, max_lon, max_lat in edges:
+        if min_lon < lon <= max_lon and lat <= max_lat:
+            # min_lon < max_lon here, so the edge is not vertical
+            x_intersect = (lon - p1_lon) * (p2_lat - p1_lat) / (p2_lon - p1_lon) + p1_lat
+            if p1_lat == p2_lat or lat <= x_intersect:
+                inside = not inside
+    return inside
+
+
+def _distance_to_edges_km(lat: float, lon: float, edges: Tuple[Tuple[float, ...], ...]) -> float:
+    """
+    Minimum distance from a point to precomputed edges in km.
+
+    Projects the point onto each edge in degree space; if the projection
+    falls outside the edge, the nearer endpoint is used instead.
+    """
+    min_distance_km = float('inf')
+    for v1_lat, v1_lon, v2_lat, v2_lon, dx, dy, length_sq, _, _, _ in edges:
+        if dx == 0 and dy == 0:
+            distance_km = _haversine_distance(lat, lon, v1_lat, v1_lon)
+        else:
+            t = ((lon - v1_lon) * dx + (lat - v1_lat) * dy) / length_sq
+            if t < 0:
+                distance_km = _haversine_distance(lat, lon, v1_lat, v1_lon)
+            elif t > 1:
+                distance_km = _haversine_distance(lat, lon, v2_lat, v2_lon)
+            else:
+                distance_km = _haversine_distance(lat, lon, v1_lat + t * dy, v1_lon + t * dx)
+        min_distance_km = min(min_distance_km, distance_km)
+    return min_distance_km
+
+
 class SiteBoundary:
     """
     Represents a protected site boundary.
@@ -50,6 +125,9 @@ class SiteBoundary:
         if radius_m is None and polygon_vertices is None:
             raise ValueError("Must provide either radius_m or polygon_vertices")
 
+        # Polygon edges are fixed for the boundary's lifetime; prepare them once
+        self._edges = _polygon_edges(polygon_vertices) if polygon_vertices is not None else None
+
         logger.info(f"Initialized SiteBoundary for {site_name} "
                    f"(center: {center_lat:.4f}, {center_lon:.4f}, "
                    f"buffer: {safety_buffer_m}m)")
@@ -66,7 +144,7 @@ class SiteBoundary:
         """
         if self.radius_m is not None:
             # Circular boundary
-            distance_m = self._haversine_distance(
+            distance_m = _haversine_distance(
                 self.center_lat, self.center_lon, lat, lon
             ) * 1000
 
@@ -76,125 +154,49 @@ class SiteBoundary:
         elif self.polygon_vertices is not None:
             # Polygon boundary
             # First check if inside polygon
-            if self._point_in_polygon(lat, lon, self.polygon_vertices):
+            if _point_in_edges(lat, lon, self._edges):
                 return True
 
             # Then check if within safety buffer of any polygon edge
-            return self._distance_to_polygon(lat, lon, self.polygon_vertices) <= self.safety_buffer_m
+            return _distance_to_edges_km(lat, lon, self._edges) * 1000 <= self.safety_buffer_m
 
         return False
 
-    def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Haversine distance in kilometers"""
-        R = 6371.0
-
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
-
-        a = (math.sin(delta_lat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) *
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
-
-    def _point_in_polygon(self, lat: float, lon: float, vertices: List[Tuple[float, float]]) -> bool:
+    def is_inside_boundary_batch(self, points: List[Tuple[float, float]]) -> List[bool]:
         """
-        Ray casting algorithm to check if point is inside polygon.
+        Check many points against the site boundary in one pass.
 
-        Args:
-            lat, lon: Point to check
-            vertices: List of (lat, lon) polygon vertices
-
-        Returns:
-            True if inside polygon, False otherwise
-        """
-        n = len(vertices)
-        inside = False
-
-        p1_lat, p1_lon = vertices[0]
-        for i in range(1, n + 1):
-            p2_lat, p2_lon = vertices[i % n]
-
-            if lon > min(p1_lon, p2_lon):
-                if lon <= max(p1_lon, p2_lon):
-                    if lat <= max(p1_lat, p2_lat):
-                        if p1_lon != p2_lon:
-                            x_intersect = (lon - p1_lon) * (p2_lat - p1_lat) / (p2_lon - p1_lon) + p1_lat
-                        if p1_lat == p2_lat or lat <= x_intersect:
-                            inside = not inside
-
-            p1_lat, p1_lon = p2_lat, p2_lon
-
-        return inside
-
-    def _distance_to_polygon(self, lat: float, lon: float, vertices: List[Tuple[float, float]]) -> float:
-        """
-        Compute minimum distance from point to polygon edges.
+        Same result as is_inside_boundary for each point; for circular
+        boundaries the site center's terms are computed once per batch.
 
         Args:
-            lat, lon: Point to check
-            vertices: List of (lat, lon) polygon vertices
+            points: List of (lat, lon) points to check
 
         Returns:
-            Minimum distance in meters
+            List of booleans, True where the point is inside boundary + buffer
         """
-        min_distance_km = float('inf')
-
-        n = len(vertices)
-        for i in range(n):
-            v1 = vertices[i]
-            v2 = vertices[(i + 1) % n]
+        if self.radius_m is None:
+            return [self.is_inside_boundary(lat, lon) for lat, lon in points]
 
-            # Distance to edge segment
-            distance_km = self._distance_to_segment(lat, lon, v1, v2)
-            min_distance_km = min(min_distance_km, distance_km)
-
-        return min_distance_km * 1000  # Convert to meters
-
-    def _distance_to_segment(
-        self,
-        lat: float,
-        lon: float,
-        v1: Tuple[float, float],
-        v2: Tuple[float, float]
-    ) -> float:
-        """
-        Compute distance from point to line segment.
+        R = 6371.0
+        limit_m = self.radius_m + self.safety_buffer_m
+        center_lat = self.center_lat
+        center_lon = self.center_lon
+        cos_center = math.cos(math.radians(center_lat))
 
-        Uses perpendicular projection if within segment bounds,
-        otherwise distance to nearest endpoint.
+        inside = []
+        for lat, lon in points:
+            delta_lat = math.radians(lat - center_lat)
+            delta_lon = math.radians(lon - center_lon)
 
-        Returns:
-            Distance in kilometers
-        """
-        v1_lat, v1_lon = v1
-        v2_lat, v2_lon = v2
+            a = (math.sin(delta_lat / 2) ** 2 +
+                 cos_center * math.cos(math.radians(lat)) *
+                 math.sin(delta_lon / 2) ** 2)
+            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-        # Vector from v1 to v2
-        dx = v2_lon - v1_lon
-        dy = v2_lat - v1_lat
+            inside.append(R * c * 1000 <= limit_m)
 
-        if dx == 0 and dy == 0:
-            # v1 and v2 are the same point
-            return self._haversine_distance(lat, lon, v1_lat, v1_lon)
-
-        # Parameter t for projection onto line
-        t = ((lon - v1_lon) * dx + (lat - v1_lat) * dy) / (dx * dx + dy * dy)
-
-        if t < 0:
-            # Closest to v1
-            return self._haversine_distance(lat, lon, v1_lat, v1_lon)
-        elif t > 1:
-            # Closest to v2
-            return self._haversine_distance(lat, lon, v2_lat, v2_lon)
-        else:
-            # Project onto segment
-            proj_lat = v1_lat + t * dy
-            proj_lon = v1_lon + t * dx
-            return self._haversine_distance(lat, lon, proj_lat, proj_lon)
+        return inside
 
 
 # Known site boundaries (can be extended)
@@ -251,7 +253,7 @@ def get_site_boundary_by_location(lat: float, lon: float, radius_km: float = 5.0
     min_distance = float('inf')
 
     for site in KNOWN_SITES.values():
-        distance_km = site._haversine_distance(site.center_lat, site.center_lon, lat, lon)
+        distance_km = _haversine_distance(site.center_lat, site.center_lon, lat, lon)
 
         if distance_km <= radius_km and distance_km < min_distance:
             min_distance = distance_km
@@ -0,0 +1,32 @@
+"""Process Pool - Shared worker processes for CPU-bound service work.
+
+Evidence stack building and operator analysis are pure Python and CPU-bound,
+so threads do not speed them up. Large batches are instead spread over one
+lazily created process pool shared by all services.
+
+Each caller only uses the pool above its own batch-size threshold: below it,
+pickling the inputs and the IPC round trip cost more than the work saves.
+
+Architecture Layer: services/
+Dependencies: none
+"""
+
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import threading
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Create the shared worker pool on first use (spawned, not forked, since
+    callers run inside a threaded server)."""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
@@ -20,6 +20,7 @@ from .los_analyzer import (
     compute_line_of_sight,
     has_los_to_target,
     compute_los_quality_score,
+    compute_los_quality_scores,
 )
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     "compute_line_of_sight",
     "has_los_to_target",
     "compute_los_quality_score",
+    "compute_los_quality_scores",
 ]
@@ -60,14 +60,21 @@ def compute_cover_score(lat: float, lon: float,
     Returns:
         Cover score 0.0-1.0 (higher = better cover)
     """
-    # Get landuse-based cover
     landuse = get_landuse_at_point(lat, lon, osm_data)
+    elevation = get_elevation_at_point(lat, lon, elevation_map)
+    center_elevation = get_elevation_at_point(osm_data.center_lat, osm_data.center_lon, elevation_map)
+
+    return _cover_from_terrain(lat, lon, osm_data, landuse, elevation, center_elevation)
+
+
+def _cover_from_terrain(lat: float, lon: float, osm_data: OSMData,
+                        landuse: str, elevation: float, center_elevation: float) -> float:
+    """Cover score from an already resolved landuse and elevations."""
+    # Get landuse-based cover
     base_cover = LANDUSE_COVER_SCORES.get(landuse, 0.40)
 
     # Elevation bonus: higher ground = better vantage but maybe less cover
     # Lower ground (valleys) = better concealment
-    elevation = get_elevation_at_point(lat, lon, elevation_map)
-    center_elevation = get_elevation_at_point(osm_data.center_lat, osm_data.center_lon, elevation_map)
     elev_diff = elevation - center_elevation
 
     # Slight bonus for being in a depression (harder to spot)
@@ -108,8 +115,18 @@ def compute_concealment_score(lat: float, lon: float,
     Returns:
         Concealment score 0.0-1.0 (higher = better concealment)
     """
-    # Get landuse-based concealment
     landuse = get_landuse_at_point(lat, lon, osm_data)
+    elevation = get_elevation_at_point(lat, lon, elevation_map)
+    center_elevation = get_elevation_at_point(osm_data.center_lat, osm_data.center_lon, elevation_map)
+
+    return _concealment_from_terrain(lat, lon, landuse, elevation, center_elevation, time_of_day)
+
+
+def _concealment_from_terrain(lat: float, lon: float, landuse: str,
+                              elevation: float, center_elevation: float,
+                              time_of_day: str) -> float:
+    """Concealment score from an already resolved landuse and elevations."""
+    # Get landuse-based concealment
     base_concealment = LANDUSE_COVER_SCORES.get(landuse, 0.40) * \
                       LANDUSE_CONCEALMENT_MULT.get(landuse, 0.6)
 
@@ -120,8 +137,6 @@ def compute_concealment_score(lat: float, lon: float,
         night_bonus = 0.0
 
     # Terrain roughness: varied elevation = better concealment
-    elevation = get_elevation_at_point(lat, lon, elevation_map)
-    center_elevation = get_elevation_at_point(osm_data.center_lat, osm_data.center_lon, elevation_map)
     elev_variance = abs(elevation - center_elevation)
 
     # Moderate elevation variance is good for concealment
@@ -145,11 +160,17 @@ def compute_combined_cover_concealment(lat: float, lon: float,
     """
     Compute both cover and concealment scores.
 
+    Landuse and elevations are looked up once and shared by both scores.
+
     Returns:
         Dict with 'cover', 'concealment', and 'combined' scores
     """
-    cover = compute_cover_score(lat, lon, osm_data, elevation_map)
-    concealment = compute_concealment_score(lat, lon, osm_data, elevation_map, time_of_day)
+    landuse = get_landuse_at_point(lat, lon, osm_data)
+    elevation = get_elevation_at_point(lat, lon, elevation_map)
+    center_elevation = get_elevation_at_point(osm_data.center_lat, osm_data.center_lon, elevation_map)
+
+    cover = _cover_from_terrain(lat, lon, osm_data, landuse, elevation, center_elevation)
+    concealment = _concealment_from_terrain(lat, lon, landuse, elevation, center_elevation, time_of_day)
 
     # Combined score: weighted average (cover slightly more important)
     combined = 0.6 * cover + 0.4 * concealment
@@ -158,5 +179,5 @@ def compute_combined_cover_concealment(lat: float, lon: float,
         "cover": cover,
         "concealment": concealment,
         "combined": combined,
-        "landuse": get_landuse_at_point(lat, lon, osm_data),
+        "landuse": landuse,
     }
@@ -5,33 +5,118 @@ Loads and caches elevation data for terrain analysis.
 Uses synthetic data for now, real DEM integration coming later.
 """
 
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import math
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache
-_elevation_cache: Dict[Tuple[float, float], float] = {}
 
+class ElevationMap(Dict[Tuple[float, float], float]):
+    """Read-only elevation samples keyed by rounded (lat, lon).
 
-def load_elevation(lat: float, lon: float, radius_km: float) -> Dict[Tuple[float, float], float]:
+    A dict whose samples are fixed at construction, plus a uniform bucket
+    grid over its keys so the nearest sample to an off-grid point is found
+    by checking a few neighbouring cells instead of every sample. The grid
+    is built on first lookup. Maps are shared through load_elevation's
+    cache, so every mutating method raises TypeError.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._grid: Optional[Dict[Tuple[int, int], List[Tuple[int, Tuple[float, float]]]]] = None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("ElevationMap is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Default dict-subclass pickling refills through __setitem__
+        return (ElevationMap, (dict(self),))
+
+    def nearest_key(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Key nearest to (lat, lon) by _distance.
+
+        Same result as min(self, key=distance): ties go to the earliest
+        inserted key. Requires a non-empty map.
+        """
+        if self._grid is None:
+            self._build_grid()
+
+        cell = self._cell_size
+        ci = math.floor((lat - self._min_lat) / cell)
+        cj = math.floor((lon - self._min_lon) / cell)
+        last = self._cells
+
+        # Rings closer than the grid's edge are empty
+        ring = max(0, -ci, ci - last, -cj, cj - last)
+        best: Optional[Tuple[float, int, Tuple[float, float]]] = None
+
+        while True:
+            for i in range(max(0, ci - ring), min(last, ci + ring) + 1):
+                edge_row = abs(i - ci) == ring
+                for j in range(max(0, cj - ring), min(last, cj + ring) + 1):
+                    if not edge_row and abs(j - cj) != ring:
+                        continue
+                    for order, key in self._grid.get((i, j), ()):
+                        dist = _distance(lat, lon, key[0], key[1])
+                        if best is None or (dist, order) < best[:2]:
+                            best = (dist, order, key)
+
+            # Unvisited cells are more than ring cells away (half a cell of
+            # slack for points binned across a boundary by rounding)
+            if best is not None and best[0] < (ring - 0.5) * cell:
+                return best[2]
+            if ring > last + max(abs(ci), abs(cj)):
+                return best[2]
+            ring += 1
+
+    def _build_grid(self) -> None:
+        """Bin every key into square cells about one sample spacing wide."""
+        keys = list(self)
+        self._min_lat = min(k[0] for k in keys)
+        self._min_lon = min(k[1] for k in keys)
+        span = max(max(k[0] for k in keys) - self._min_lat, max(k[1] for k in keys) - self._min_lon)
+
+        self._cells = max(1, math.isqrt(len(keys)))
+        self._cell_size = span / self._cells or 1.0
+
+        grid: Dict[Tuple[int, int], List[Tuple[int, Tuple[float, float]]]] = {}
+        for order, key in enumerate(keys):
+            cell = (
+                math.floor((key[0] - self._min_lat) / self._cell_size),
+                math.floor((key[1] - self._min_lon) / self._cell_size),
+            )
+            grid.setdefault(cell, []).append((order, key))
+
+        self._grid = grid
+
+
+@lru_cache(maxsize=32)
+def load_elevation(lat: float, lon: float, radius_km: float) -> ElevationMap:
     """
     Load elevation data for a region.
 
+    Cached per exact (lat, lon, radius_km), so repeat analyses of a target
+    reuse the same read-only map (and its nearest-sample grid). At the
+    default 4 km search radius a map is about 0.36 MB with its grid.
+
     Args:
         lat: Center latitude
         lon: Center longitude
         radius_km: Radius in kilometers
 
     Returns:
-        Dict mapping (lat, lon) to elevation in meters
+        ElevationMap (dict) mapping (lat, lon) to elevation in meters
     """
     logger.info(f"Loading elevation data for ({lat}, {lon}) radius {radius_km}km")
 
     # TODO Sprint 4.1: Add real DEM (Digital Elevation Model) integration
     # For now, use synthetic elevation based on distance and angle
-    elevation_map = {}
+    samples: Dict[Tuple[float, float], float] = {}
 
     # Sample points in a grid
     samples_per_km = 4
@@ -44,9 +129,9 @@ def load_elevation(lat: float, lon: float, radius_km: float) -> Dict[Tuple[float
                         (j * 2 * radius_km / (111.0 * math.cos(math.radians(lat))) / num_samples)
 
             elevation = _generate_synthetic_elevation(lat, lon, sample_lat, sample_lon)
-            elevation_map[(round(sample_lat, 5), round(sample_lon, 5))] = elevation
+            samples[(round(sample_lat, 5), round(sample_lon, 5))] = elevation
 
-    return elevation_map
+    return ElevationMap(samples)
 
 
 def get_elevation_at_point(lat: float, lon: float, elevation_map: Dict[Tuple[float, float], float]) -> float:
@@ -71,8 +156,11 @@ def get_elevation_at_point(lat: float, lon: float, elevation_map: Dict[Tuple[flo
     if not elevation_map:
         return _generate_synthetic_elevation(lat, lon, lat, lon)
 
-    nearest_key = min(elevation_map.keys(),
-                     key=lambda k: _distance(lat, lon, k[0], k[1]))
+    if isinstance(elevation_map, ElevationMap):
+        nearest_key = elevation_map.nearest_key(lat, lon)
+    else:
+        nearest_key = min(elevation_map.keys(),
+                         key=lambda k: _distance(lat, lon, k[0], k[1]))
     return elevation_map[nearest_key]
 
 
@@ -33,6 +33,16 @@ def compute_line_of_sight(operator_lat: float, operator_lon: float,
     operator_elev = get_elevation_at_point(operator_lat, operator_lon, elevation_map)
     target_elev = get_elevation_at_point(target_lat, target_lon, elevation_map)
 
+    return _trace_line_of_sight(operator_lat, operator_lon, operator_elev,
+                                target_lat, target_lon, target_elev,
+                                elevation_map, num_samples)
+
+
+def _trace_line_of_sight(operator_lat: float, operator_lon: float, operator_elev: float,
+                         target_lat: float, target_lon: float, target_elev: float,
+                         elevation_map: Dict[Tuple[float, float], float],
+                         num_samples: int) -> Dict:
+    """compute_line_of_sight with both endpoint elevations already looked up."""
     # Check intermediate points
     max_obstruction = 0.0
     blocked = False
@@ -124,6 +134,41 @@ def compute_los_quality_score(operator_lat: float, operator_lon: float,
                                        target_lat, target_lon,
                                        elevation_map)
 
+    return _los_quality_from_result(los_result)
+
+
+def compute_los_quality_scores(operator_points: List[Tuple[float, float]],
+                               target_lat: float, target_lon: float,
+                               elevation_map: Dict[Tuple[float, float], float]) -> List[float]:
+    """
+    Compute LOS quality scores for many operator locations to one target.
+
+    Same scores as compute_los_quality_score per point; the target's
+    elevation is looked up once for the whole batch.
+
+    Args:
+        operator_points: List of (lat, lon) operator locations
+        target_lat, target_lon: Target location
+        elevation_map: Elevation data
+
+    Returns:
+        LOS quality score 0.0-1.0 per operator location, in input order
+    """
+    target_elev = get_elevation_at_point(target_lat, target_lon, elevation_map)
+
+    scores = []
+    for operator_lat, operator_lon in operator_points:
+        operator_elev = get_elevation_at_point(operator_lat, operator_lon, elevation_map)
+        los_result = _trace_line_of_sight(operator_lat, operator_lon, operator_elev,
+                                          target_lat, target_lon, target_elev,
+                                          elevation_map, 10)
+        scores.append(_los_quality_from_result(los_result))
+
+    return scores
+
+
+def _los_quality_from_result(los_result: Dict) -> float:
+    """LOS quality score from a compute_line_of_sight result."""
     base_quality = los_result["quality"]
 
     # Bonus for elevated position (better vantage point)
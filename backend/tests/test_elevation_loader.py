@@ -0,0 +1,51 @@
+"""
+Unit tests for elevation map nearest-sample lookups.
+"""
+
+import pickle
+import random
+
+import pytest
+
+from backend.app.services.terrain.elevation_loader import (
+    ElevationMap,
+    _distance,
+    get_elevation_at_point,
+    load_elevation,
+)
+
+
+def _linear_nearest(elevation_map, lat, lon):
+    return min(elevation_map.keys(), key=lambda k: _distance(lat, lon, k[0], k[1]))
+
+
+class TestNearestKey:
+    """Test the bucket-grid lookup against a linear scan"""
+
+    def test_matches_linear_scan(self):
+        """Test off-grid points inside and around the map resolve like min()"""
+        elevation_map = load_elevation(51.6564, 5.7083, 4.0)
+        rng = random.Random(7)
+        for _ in range(500):
+            lat = 51.6564 + rng.uniform(-0.1, 0.1)
+            lon = 5.7083 + rng.uniform(-0.15, 0.15)
+            assert elevation_map.nearest_key(lat, lon) == _linear_nearest(elevation_map, lat, lon)
+
+    def test_ties_go_to_first_inserted(self):
+        """Test equidistant samples resolve to the earliest key, as min() does"""
+        elevation_map = ElevationMap({(0.0, 1.0): 10.0, (0.0, -1.0): 20.0, (1.0, 0.0): 30.0})
+        assert elevation_map.nearest_key(0.0, 0.0) == (0.0, 1.0)
+
+    def test_cached_map_is_read_only(self):
+        """Test the shared map rejects writes but still pickles"""
+        elevation_map = load_elevation(51.6564, 5.7083, 4.0)
+        assert get_elevation_at_point(51.66, 5.71, elevation_map) is not None
+        with pytest.raises(TypeError):
+            elevation_map[(0.0, 0.0)] = 10.0
+        with pytest.raises(TypeError):
+            elevation_map.update({(0.0, 0.0): 10.0})
+        with pytest.raises(TypeError):
+            elevation_map.pop(next(iter(elevation_map)))
+
+        copy = pickle.loads(pickle.dumps(elevation_map))
+        assert isinstance(copy, ElevationMap) and copy == elevation_map
@@ -0,0 +1,121 @@
+"""
+Unit tests for the evidence stack builder.
+"""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from backend.app.domain import Evidence, SourceType
+from backend.app.services import evidence_stack
+from backend.app.services.evidence_stack import EvidenceStack, build_evidence_stack
+
+ARTICLE = (
+    "A drone with red and green lights was seen hovering over Volkel air base "
+    "around 21:30 on Tuesday evening before flying off to the northeast, "
+    "according to several local residents who reported it to the police"
+)
+
+
+def _evidence(i: int, raw_text: str, url: str = None) -> Evidence:
+    return Evidence(id=i, incident_id=1, source_type=SourceType.NEWS,
+                    source_name=f"Source {i}", url=url, raw_text=raw_text)
+
+
+class TestDeduplication:
+    """Test exact and near-duplicate filtering in build_stack"""
+
+    def test_exact_url_duplicates_removed(self):
+        """Test a repeated URL is dropped regardless of content"""
+        stack = build_evidence_stack(1, [
+            _evidence(1, ARTICLE, url="https://example.com/a"),
+            _evidence(2, "Completely different text", url="https://example.com/a"),
+        ])
+        assert stack.total_items == 1
+        assert stack.duplicates_removed == 1
+
+    def test_text_matching_a_url_kept(self):
+        """Test a URL-less record whose text equals another record's URL is kept"""
+        stack = build_evidence_stack(1, [
+            _evidence(1, ARTICLE, url="https://example.com/a"),
+            _evidence(2, "https://example.com/a"),
+        ])
+        assert stack.total_items == 2
+        assert stack.duplicates_removed == 0
+
+    def test_mirrored_article_removed(self):
+        """Test a repost with a different URL and trivial edits is dropped"""
+        stack = build_evidence_stack(1, [
+            _evidence(1, ARTICLE, url="https://example.com/a"),
+            _evidence(2, ARTICLE.upper() + " police", url="https://mirror.example.org/a"),
+        ])
+        assert stack.total_items == 1
+        assert stack.duplicates_removed == 1
+
+    def test_distinct_reports_kept(self):
+        """Test different reports of the same incident are kept"""
+        stack = build_evidence_stack(1, [
+            _evidence(1, ARTICLE),
+            _evidence(2, "Drone seen near Volkel air base at night"),
+            _evidence(3, "Police searched the area around the base but found no operator"),
+            _evidence(4, "Defence ministry confirms airspace violation over Volkel on Tuesday"),
+        ])
+        assert stack.total_items == 4
+        assert stack.duplicates_removed == 0
+
+
+class TestStackConstruction:
+    """Test stacks built without validation still satisfy the models"""
+
+    def test_stack_round_trips_through_validation(self):
+        """Test model_construct output validates as EvidenceStack"""
+        evidence = [
+            Evidence(id=i, incident_id=1, source_type=source_type, source_name="Omroep Brabant lokaal",
+                     url=f"https://example.com/{i}", raw_text=f"Drone near Volkel base at night ({i})",
+                     published_at=datetime(2025, 1, 1, 22, i), meta={"likes": i})
+            for i, source_type in enumerate(SourceType)
+        ]
+        stack = build_evidence_stack(1, evidence)
+
+        validated = EvidenceStack.model_validate(stack.model_dump())
+        assert validated == stack
+        assert stack.total_items == len(SourceType)
+
+    def test_items_are_frozen(self):
+        """Test items reject assignment, so their shared fields-set stays intact"""
+        stack = build_evidence_stack(1, [_evidence(1, ARTICLE)])
+        item = stack.news_articles[0]
+        with pytest.raises(ValidationError):
+            item.credibility_score = 0.0
+
+        copy = item.model_copy(update={"credibility_score": 0.0})
+        assert copy.credibility_score == 0.0
+        assert item.credibility_score == 0.85
+
+
+class TestParallelBuild:
+    """Test large batches built in worker processes match a sequential build"""
+
+    def test_parallel_matches_sequential(self, monkeypatch):
+        """Test item creation in the process pool gives the same stack"""
+        evidence = [
+            Evidence(id=i, incident_id=1, source_type=list(SourceType)[i % len(SourceType)],
+                     source_name=f"Source {i % 7} local", url=f"https://example.com/{i}",
+                     raw_text=f"Report {i}: drone near the base at night, hoax {i * 7919}",
+                     published_at=datetime(2025, 1, 1 + i % 28, 22, 0))
+            for i in range(40)
+        ]
+        monkeypatch.setattr(evidence_stack, "_PARALLEL_MIN_RECORDS", 10**9)
+        sequential = build_evidence_stack(1, evidence)
+        monkeypatch.setattr(evidence_stack, "_PARALLEL_MIN_RECORDS", 1)
+        monkeypatch.setattr(evidence_stack, "_PARALLEL_CHUNK_SIZE", 16)
+        parallel = build_evidence_stack(1, evidence)
+
+        exclude = {"collected_at": True, **{
+            category: {"__all__": {"collected_at"}}
+            for category in ("official_reports", "news_articles", "social_media_posts", "telegram_messages",
+                             "youtube_videos", "forum_posts", "witness_statements")
+        }}
+        assert parallel.model_dump(exclude=exclude) == sequential.model_dump(exclude=exclude)
+        assert parallel.total_items == 40
@@ -0,0 +1,154 @@
+"""
+Unit tests for the intelligence response cache.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from backend.app.api import incidents
+from backend.app.domain import Evidence, Incident, SourceType
+from backend.app.llm.evidence_enricher import EvidenceEnricher
+from backend.app.services.intelligence_cache import TTLCache, fingerprint, make_cache_key
+
+
+class TestTTLCache:
+    """Test TTL + LRU cache behaviour"""
+
+    def test_get_returns_stored_value(self):
+        """Test value round-trip"""
+        cache = TTLCache(maxsize=4, ttl_seconds=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self):
+        """Test entries are not served after their TTL"""
+        cache = TTLCache(maxsize=4, ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test maxsize evicts the least recently used key"""
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+# Incident fields rendered into the response: title, country, occurred_at, location
+INCIDENT = ("Drone over Volkel", "NL", datetime(2025, 1, 1, 22, 0), "Volkel Air Base")
+
+
+class TestCacheKey:
+    """Test intelligence cache key construction"""
+
+    def test_new_evidence_changes_key(self):
+        """Test that adding evidence invalidates the cached entry"""
+        before = make_cache_key(1, 3, 12, "military", 51.6564, 5.7083, "mock", False, INCIDENT)
+        after = make_cache_key(1, 4, 13, "military", 51.6564, 5.7083, "mock", False, INCIDENT)
+        assert before != after
+
+    def test_coordinates_are_rounded(self):
+        """Test sub-meter coordinate noise maps to the same key"""
+        a = make_cache_key(1, 3, 12, None, 51.6564001, 5.7083001, "mock", False, INCIDENT)
+        b = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False, INCIDENT)
+        assert a == b
+
+    def test_llm_mode_changes_key(self):
+        """Test mock results are not reused for live enrichment or another model"""
+        mock = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False, INCIDENT)
+        live = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "claude-3-5-sonnet-20241022", True, INCIDENT)
+        other = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "claude-3-5-haiku-20241022", True, INCIDENT)
+        assert len({mock, live, other}) == 3
+
+    def test_incident_edit_changes_fingerprint(self):
+        """Test a renamed incident or site is not served from its old snapshot"""
+        before = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False, INCIDENT)
+        retitled = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False,
+                                  ("Drones over Volkel",) + INCIDENT[1:])
+        renamed = make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False,
+                                 INCIDENT[:3] + ("Vliegbasis Volkel",))
+        assert len({fingerprint(before), fingerprint(retitled), fingerprint(renamed)}) == 3
+        assert fingerprint(before) == fingerprint(
+            make_cache_key(1, 3, 12, None, 51.6564, 5.7083, "mock", False, INCIDENT))
+
+
+class _StubResult:
+    """Result object for the two non-ORM reads the route makes."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def one(self):
+        return self._rows[0]
+
+    def all(self):
+        return self._rows
+
+
+class _StubSession:
+    """Just enough of AsyncSession for get_incident_intelligence."""
+
+    def __init__(self, incident, evidence):
+        self._incident = incident
+        self._evidence = evidence
+        self.merged = []
+
+    async def get(self, model, ident, options=None):
+        return self._incident if model is Incident else None
+
+    async def execute(self, statement):
+        return _StubResult([(len(self._evidence), max(e.id for e in self._evidence))])
+
+    async def scalars(self, statement):
+        return _StubResult(self._evidence)
+
+    async def merge(self, instance):
+        self.merged.append(instance)
+
+    async def commit(self):
+        pass
+
+
+class TestIntelligenceMaterialization:
+    """Test which intelligence responses are cached and snapshotted"""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(incidents, "intelligence_cache", TTLCache(maxsize=4, ttl_seconds=60))
+        incident = Incident(id=1, title="Drone over Volkel", country_code="NL",
+                            occurred_at=datetime(2025, 1, 1, 22, 0))
+        evidence = [
+            Evidence(id=i, incident_id=1, source_type=SourceType.NEWS, source_name=f"Source {i}",
+                     raw_text=f"Drone seen near Volkel air base at night ({i})")
+            for i in range(1, 4)
+        ]
+        return _StubSession(incident, evidence)
+
+    def test_successful_enrichment_is_materialized(self, session):
+        """Test a mock-enriched response is cached and snapshotted"""
+        asyncio.run(incidents.get_incident_intelligence(1, db=session))
+
+        assert len(incidents.intelligence_cache) == 1
+        assert [snapshot.incident_id for snapshot in session.merged] == [1]
+
+    def test_failed_enrichment_is_not_materialized(self, session, monkeypatch):
+        """Test a failed LLM call is served but neither cached nor snapshotted"""
+        async def failing_enrichment(incident_id, evidence_stack, use_cache=True):
+            return EvidenceEnricher._failed_enrichment(incident_id, evidence_stack, "overloaded")
+
+        monkeypatch.setattr(incidents, "enrich_incident_async", failing_enrichment)
+        response = asyncio.run(incidents.get_incident_intelligence(1, db=session))
+
+        assert b"LLM enrichment failed" in response.body
+        assert len(incidents.intelligence_cache) == 0
+        assert session.merged == []
@@ -0,0 +1,67 @@
+"""
+Unit tests for the intelligence response mapping.
+
+The mapping builds the contract models with model_construct() (no
+validation), so these tests check the result still satisfies the contract.
+"""
+
+import warnings
+from datetime import datetime
+
+import pytest
+
+from backend.app.api.incidents import _build_intelligence_response
+from backend.app.api.schemas.intelligence import IntelligenceResponse
+from backend.app.domain import Evidence, Incident, SourceType
+from backend.app.llm.evidence_enricher import enrich_incident
+from backend.app.services.evidence_stack import build_evidence_stack
+from backend.app.services.operator_hideout import analyze_operator_location
+
+
+@pytest.fixture
+def response(monkeypatch) -> IntelligenceResponse:
+    """Intelligence response for a Volkel incident with mixed evidence (mock LLM)."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    incident = Incident(id=1, title="Drone over Volkel", country_code="NL",
+                        occurred_at=datetime(2025, 1, 1, 22, 0))
+    evidence = [
+        Evidence(id=i, incident_id=1, source_type=source_type,
+                 source_name=f"Source {i}", url=f"https://example.com/{i}" if i % 2 else None,
+                 raw_text=f"Drone seen near Volkel air base at night ({i})",
+                 published_at=datetime(2025, 1, 1, 22, i))
+        for i, source_type in enumerate(SourceType)
+    ]
+
+    evidence_stack = build_evidence_stack(1, evidence)
+    enriched = enrich_incident(1, evidence_stack)
+    operator = analyze_operator_location(1, 51.6564, 5.7083, site_type="military")
+
+    return _build_intelligence_response(
+        incident, "Volkel Air Base", 51.6564, 5.7083, evidence_stack, enriched, operator
+    )
+
+
+class TestIntelligenceResponseMapping:
+    """Test the unvalidated mapping against the response contract"""
+
+    def test_payload_validates_against_contract(self, response):
+        """Test the serialized payload round-trips through full validation"""
+        payload = response.model_dump(mode="json")
+        assert IntelligenceResponse.model_validate(payload).model_dump(mode="json") == payload
+
+    def test_serializes_without_type_warnings(self, response):
+        """Test every constructed field holds the declared type"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            response.model_dump(mode="json")
+
+    def test_shape(self, response):
+        """Test sections, ranks and limits"""
+        assert response.incident.location_name == "Volkel Air Base"
+        assert [h.rank for h in response.operator_hotspots] == list(
+            range(1, len(response.operator_hotspots) + 1)
+        )
+        assert len(response.evidence) <= 10
+        assert response.meta.llm_mode == "mock"
+        assert response.meta.llm_model is None
@@ -0,0 +1,64 @@
+"""
+Unit tests for the content-addressed LLM response cache.
+"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+
+from backend.app.config import settings
+from backend.app.domain.llm_cache_entry import LLMCacheEntry
+from backend.app.llm import llm_cache
+
+
+@pytest.fixture
+def cache_db(monkeypatch):
+    """Point the cache at an in-memory SQLite database."""
+    engine = create_engine("sqlite://")
+    LLMCacheEntry.__table__.create(engine)
+    monkeypatch.setattr(llm_cache, "_engine", engine)
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", True)
+    yield engine
+    engine.dispose()
+
+
+class TestMakeKey:
+    """Test prompt hashing"""
+
+    def test_key_is_stable_sha256(self):
+        """Test same inputs give the same 64-char digest"""
+        key = llm_cache.make_key("model", "system", "prompt")
+        assert key == llm_cache.make_key("model", "system", "prompt")
+        assert len(key) == 64
+
+    def test_every_part_changes_the_key(self):
+        """Test model, system prompt and prompt all feed the key"""
+        base = llm_cache.make_key("model", "system", "prompt")
+        assert llm_cache.make_key("other", "system", "prompt") != base
+        assert llm_cache.make_key("model", "other", "prompt") != base
+        assert llm_cache.make_key("model", "system", "other") != base
+        # Part boundaries are unambiguous
+        assert llm_cache.make_key("ab", "c", "") != llm_cache.make_key("a", "bc", "")
+
+
+class TestLLMCache:
+    """Test get/set against the llm_cache table"""
+
+    def test_round_trip_and_upsert(self, cache_db):
+        """Test stored responses are returned and overwritten in place"""
+        assert llm_cache.get("k") is None
+        llm_cache.set("k", {"intelligence_summary": "first"})
+        llm_cache.set("k", {"intelligence_summary": "second"})
+        assert llm_cache.get("k") == {"intelligence_summary": "second"}
+
+    def test_expired_entry_is_a_miss(self, cache_db):
+        """Test entries are not served after their TTL"""
+        llm_cache.set("k", {"intelligence_summary": "old"}, ttl=timedelta(seconds=-1))
+        assert llm_cache.get("k") is None
+
+    def test_disabled_cache_is_bypassed(self, cache_db, monkeypatch):
+        """Test LLM_CACHE_ENABLED=false turns get/set into no-ops"""
+        monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+        llm_cache.set("k", {"intelligence_summary": "x"})
+        assert llm_cache.get("k") is None
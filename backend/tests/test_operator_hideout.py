@@ -0,0 +1,44 @@
+"""
+Unit tests for the V1 operator hideout engine.
+"""
+
+from backend.app.services import operator_hideout
+from backend.app.services.operator_hideout import (
+    OperatorAnalysis,
+    OperatorHideoutEngine,
+)
+
+
+class TestBatchAnalysis:
+    """Test batches analyzed in worker processes match a sequential run"""
+
+    def test_parallel_matches_sequential(self, monkeypatch):
+        """Test analysis in the process pool gives the same hotspots"""
+        incidents = [
+            (i, 51.0 + i * 0.01, 5.0 + i * 0.02, ("military", "airport", None)[i % 3])
+            for i in range(20)
+        ]
+        engine = OperatorHideoutEngine()
+
+        monkeypatch.setattr(operator_hideout, "_PARALLEL_MIN_INCIDENTS", 10**9)
+        sequential = engine.analyze_incidents_batch(incidents)
+        monkeypatch.setattr(operator_hideout, "_PARALLEL_MIN_INCIDENTS", 1)
+        monkeypatch.setattr(operator_hideout, "_PARALLEL_CHUNK_SIZE", 8)
+        parallel = engine.analyze_incidents_batch(incidents)
+
+        exclude = {"analyzed_at"}
+        assert [a.model_dump(exclude=exclude) for a in parallel] == \
+            [a.model_dump(exclude=exclude) for a in sequential]
+        assert [a.incident_id for a in parallel] == list(range(20))
+
+
+class TestHotspotConstruction:
+    """Test hotspots built without validation still satisfy the models"""
+
+    def test_analysis_round_trips_through_validation(self):
+        """Test model_construct hotspots validate as OperatorAnalysis"""
+        engine = OperatorHideoutEngine()
+        for site_type in ("military", "airport", None):
+            analysis = engine.analyze_incident(1, 51.6564, 5.7083, site_type)
+            assert len(analysis.predicted_hotspots) == 3
+            assert OperatorAnalysis.model_validate(analysis.model_dump()) == analysis
@@ -7,6 +7,7 @@ Tests that operator hotspots are NEVER inside protected site perimeters.
 import pytest
 from backend.app.services.operator_hideout_v2.site_boundary import (
     SiteBoundary,
+    KNOWN_SITES,
     get_site_boundary,
     get_site_boundary_by_location,
 )
@@ -109,6 +110,33 @@ class TestSiteBoundary:
         assert boundary.is_inside_boundary(51.65, 5.69) is False
         assert boundary.is_inside_boundary(51.69, 5.73) is False
 
+    def test_batch_matches_single_point(self):
+        """Test batch check agrees with per-point checks for both boundary kinds"""
+        circular = SiteBoundary(
+            site_name="Test Site",
+            center_lat=51.6564,
+            center_lon=5.7083,
+            radius_m=1000,
+            safety_buffer_m=200,
+        )
+        polygon = SiteBoundary(
+            site_name="Test Site",
+            center_lat=51.67,
+            center_lon=5.71,
+            polygon_vertices=[(51.66, 5.70), (51.66, 5.72), (51.68, 5.72), (51.68, 5.70)],
+            safety_buffer_m=100,
+        )
+        points = [
+            (51.6564 + i * 0.002, 5.7083 + j * 0.003)
+            for i in range(-10, 11)
+            for j in range(-10, 11)
+        ]
+
+        for boundary in (circular, polygon):
+            expected = [boundary.is_inside_boundary(lat, lon) for lat, lon in points]
+            assert boundary.is_inside_boundary_batch(points) == expected
+            assert True in expected and False in expected
+
     def test_get_known_site_volkel(self):
         """Test retrieval of Volkel Air Base boundary"""
         boundary = get_site_boundary("Volkel Air Base")
@@ -132,6 +160,21 @@ class TestSiteBoundary:
         boundary = get_site_boundary_by_location(52.0, 3.0, radius_km=5.0)
         assert boundary is None
 
+    def test_get_site_by_location_after_extending_sites(self, monkeypatch):
+        """Test sites added to KNOWN_SITES after a lookup are found"""
+        assert get_site_boundary_by_location(52.0, 3.0, radius_km=5.0) is None
+
+        offshore = SiteBoundary(
+            site_name="Offshore Platform",
+            center_lat=52.01,
+            center_lon=3.0,
+            radius_m=300,
+        )
+        monkeypatch.setitem(KNOWN_SITES, "Offshore Platform", offshore)
+
+        assert get_site_boundary_by_location(52.0, 3.0, radius_km=5.0) is offshore
+        assert get_site_boundary_by_location(52.0, 3.0, radius_km=1.0) is None
+
 
 class TestVolkelAirBaseConstraint:
     """Test that Volkel Air Base perimeter is enforced"""
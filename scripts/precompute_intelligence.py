@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Precompute intelligence for incidents ahead of API requests.
+
+Runs the intelligence pipeline (LLM enrichment + operator analysis) for each
+incident whose materialized snapshot is missing or stale, so the API serves
+it from the intelligence_cache table instead of computing it inline.
+Intended to run after ingestion or from cron.
+
+Usage:
+    python scripts/precompute_intelligence.py            # all incidents
+    python scripts/precompute_intelligence.py 12 15 18   # selected incidents
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select
+from backend.app.api.incidents import get_incident_intelligence
+from backend.app.db.session import SessionLocal, engine
+from backend.app.domain.incident import Incident
+
+
+async def precompute(incident_ids: list[int]) -> None:
+    """
+    Materialize intelligence for the given incidents (all if empty).
+
+    Args:
+        incident_ids: Incident IDs to process
+    """
+    async with SessionLocal() as db:
+        if not incident_ids:
+            incident_ids = list(await db.scalars(select(Incident.id).order_by(Incident.id)))
+
+    for incident_id in incident_ids:
+        # Fresh session per incident: a failure never poisons the next one
+        async with SessionLocal() as db:
+            try:
+                await get_incident_intelligence(incident_id, db=db)
+                print(f"Incident {incident_id}: OK")
+            except Exception as e:
+                print(f"Incident {incident_id}: FAILED ({e})")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(precompute([int(arg) for arg in sys.argv[1:]]))
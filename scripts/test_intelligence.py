@@ -8,14 +8,16 @@ Tests the full intelligence pipeline:
 4. Intelligence API Endpoint
 """
 
+import asyncio
 import sys
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add parent directory to path
 sys.path.insert(0, "/Users/marcel/MarLLM/drone-cuas-osint-dashboard-v2")
 
-from backend.app.db.session import SessionLocal
+from backend.app.db.session import SessionLocal, engine
 from backend.app.domain.incident import Incident
 from backend.app.domain.site import Site, SiteType
 from backend.app.domain.evidence import Evidence, SourceType
@@ -24,7 +26,7 @@ from backend.app.llm.evidence_enricher import enrich_incident
 from backend.app.services.operator_hideout import analyze_operator_location
 
 
-def create_test_data(db: Session) -> int:
+async def create_test_data(db: AsyncSession) -> int:
     """Create test site, incident, and evidence.
 
     Args:
@@ -44,7 +46,7 @@ def create_test_data(db: Session) -> int:
         site_metadata={"icao": "EHVK", "description": "Royal Netherlands Air Force base"}
     )
     db.add(site)
-    db.flush()
+    await db.flush()
 
     # Create test incident
     incident = Incident(
@@ -57,7 +59,7 @@ def create_test_data(db: Session) -> int:
         }
     )
     db.add(incident)
-    db.flush()
+    await db.flush()
 
     # Create test evidence
     evidence_items = [
@@ -103,10 +105,9 @@ def create_test_data(db: Session) -> int:
         ),
     ]
 
-    for evidence in evidence_items:
-        db.add(evidence)
+    db.add_all(evidence_items)
 
-    db.commit()
+    await db.commit()
 
     print(f"Test data created:")
     print(f"  Site ID: {site.id} - {site.name}")
@@ -117,7 +118,7 @@ def create_test_data(db: Session) -> int:
     return incident.id
 
 
-def test_evidence_stack(db: Session, incident_id: int):
+async def test_evidence_stack(db: AsyncSession, incident_id: int):
     """Test Evidence Stack Builder.
 
     Args:
@@ -129,7 +130,8 @@ def test_evidence_stack(db: Session, incident_id: int):
     print("=" * 80)
 
     # Get evidence records
-    evidence_records = db.query(Evidence).filter(Evidence.incident_id == incident_id).all()
+    result = await db.scalars(select(Evidence).where(Evidence.incident_id == incident_id))
+    evidence_records = result.all()
 
     # Build evidence stack
     stack = build_evidence_stack(incident_id, evidence_records)
@@ -269,7 +271,7 @@ def test_operator_analysis(incident_id: int):
     return analysis
 
 
-def main():
+async def main():
     """Main test execution."""
     print("=" * 80)
     print("Sprint 2 Intelligence Layer Testing")
@@ -281,10 +283,10 @@ def main():
 
     try:
         # Create test data
-        incident_id = create_test_data(db)
+        incident_id = await create_test_data(db)
 
         # Test 1: Evidence Stack Builder
-        stack = test_evidence_stack(db, incident_id)
+        stack = await test_evidence_stack(db, incident_id)
 
         # Test 2: LLM Evidence Enrichment
         enriched = test_llm_enrichment(incident_id, stack)
@@ -313,8 +315,9 @@ def main():
         sys.exit(1)
 
     finally:
-        db.close()
+        await db.close()
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())